@@ -0,0 +1,10 @@
+#Moved to findingorigin/ApproximateMatching.py. This file keeps import ApproximateMatching and
+# python ApproximateMatching.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.ApproximateMatching", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.ApproximateMatching
+    sys.modules[__name__] = sys.modules["findingorigin.ApproximateMatching"]
@@ -0,0 +1,10 @@
+#Moved to findingorigin/BatchDriver.py. This file keeps import BatchDriver and
+# python BatchDriver.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.BatchDriver", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.BatchDriver
+    sys.modules[__name__] = sys.modules["findingorigin.BatchDriver"]
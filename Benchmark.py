@@ -0,0 +1,10 @@
+#Moved to findingorigin/Benchmark.py. This file keeps import Benchmark and
+# python Benchmark.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.Benchmark", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.Benchmark
+    sys.modules[__name__] = sys.modules["findingorigin.Benchmark"]
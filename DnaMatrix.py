@@ -0,0 +1,10 @@
+#Moved to findingorigin/DnaMatrix.py. This file keeps import DnaMatrix and
+# python DnaMatrix.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.DnaMatrix", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.DnaMatrix
+    sys.modules[__name__] = sys.modules["findingorigin.DnaMatrix"]
@@ -1,38 +1,10 @@
-import re
-
-#Takes days - Do not do it
-def SymbolArray(Genome, symbol):
-    array = {}
-    n = len(Genome)
-    ExtendedGenome = Genome + Genome[0:n//2]
-    for i in range(n):
-        array[i] = PatternCount(symbol, ExtendedGenome[i:i+(n//2)])
-    return array
-
-#Takes seconds but returns a very large data. 
-def FasterSymbolArray(Genome, symbol):
-    array = {}
-    n = len(Genome)
-    ExtendedGenome = Genome + Genome[0:n//2]
-
-    #look at the first half of Genome to compute first array value
-    array[0] = PatternCount(symbol, Genome[0:n//2])
-
-    for i in range(1, n):
-        #start by setting the current array value equal to the previous array value
-        array[i] = array[i-1]
-
-        #the current array value can differ from the previous array value by at most 1
-        if ExtendedGenome[i-1] == symbol:
-            array[i] = array[i] - 1
-        if ExtendedGenome[i+(n//2)-1] == symbol:
-            array[i] = array[i] + 1
-    return array
-
-def PatternCount(Pattern, String):
-    return len(re.findall("(?=%s)"%Pattern, String))
-
-with open('EColiGenome.txt') as file:
-    e_coli = file.read()
-
-print(FasterSymbolArray(e_coli, 'C'))
+#Moved to findingorigin/ForwardReverseStrand.py. This file keeps import ForwardReverseStrand and
+# python ForwardReverseStrand.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.ForwardReverseStrand", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.ForwardReverseStrand
+    sys.modules[__name__] = sys.modules["findingorigin.ForwardReverseStrand"]
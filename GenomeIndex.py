@@ -0,0 +1,10 @@
+#Moved to findingorigin/GenomeIndex.py. This file keeps import GenomeIndex and
+# python GenomeIndex.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.GenomeIndex", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.GenomeIndex
+    sys.modules[__name__] = sys.modules["findingorigin.GenomeIndex"]
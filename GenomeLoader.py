@@ -0,0 +1,10 @@
+#Moved to findingorigin/GenomeLoader.py. This file keeps import GenomeLoader and
+# python GenomeLoader.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.GenomeLoader", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.GenomeLoader
+    sys.modules[__name__] = sys.modules["findingorigin.GenomeLoader"]
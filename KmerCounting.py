@@ -0,0 +1,10 @@
+#Moved to findingorigin/KmerCounting.py. This file keeps import KmerCounting and
+# python KmerCounting.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.KmerCounting", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.KmerCounting
+    sys.modules[__name__] = sys.modules["findingorigin.KmerCounting"]
@@ -0,0 +1,10 @@
+#Moved to findingorigin/MedianString.py. This file keeps import MedianString and
+# python MedianString.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.MedianString", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.MedianString
+    sys.modules[__name__] = sys.modules["findingorigin.MedianString"]
@@ -0,0 +1,10 @@
+#Moved to findingorigin/MotifProfile.py. This file keeps import MotifProfile and
+# python MotifProfile.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.MotifProfile", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.MotifProfile
+    sys.modules[__name__] = sys.modules["findingorigin.MotifProfile"]
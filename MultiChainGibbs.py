@@ -0,0 +1,10 @@
+#Moved to findingorigin/MultiChainGibbs.py. This file keeps import MultiChainGibbs and
+# python MultiChainGibbs.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.MultiChainGibbs", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.MultiChainGibbs
+    sys.modules[__name__] = sys.modules["findingorigin.MultiChainGibbs"]
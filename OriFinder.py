@@ -0,0 +1,10 @@
+#Moved to findingorigin/OriFinder.py. This file keeps import OriFinder and
+# python OriFinder.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.OriFinder", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.OriFinder
+    sys.modules[__name__] = sys.modules["findingorigin.OriFinder"]
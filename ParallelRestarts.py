@@ -0,0 +1,10 @@
+#Moved to findingorigin/ParallelRestarts.py. This file keeps import ParallelRestarts and
+# python ParallelRestarts.py working in a checkout; it is not installed.
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("findingorigin.ParallelRestarts", run_name="__main__", alter_sys=True)
+else:
+    import findingorigin.ParallelRestarts
+    sys.modules[__name__] = sys.modules["findingorigin.ParallelRestarts"]
@@ -0,0 +1,104 @@
+import numpy as np
+
+from .KmerCounting import MAX_K, compute_kmer_codes, encode_dna, encode_kmer
+
+#Seeds shorter than this hit too many places to be worth looking up,
+# the whole text is scanned instead.
+MIN_SEED = 6
+
+#Hamming distance between pattern_codes and the windows of codes starting at
+# each of positions. All windows are compared at once, one column at a time.
+def hamming_distances(codes, positions, pattern_codes):
+    distances = np.zeros(len(positions), dtype=np.int32)
+    for j in range(len(pattern_codes)):
+        distances += codes[positions + j] != pattern_codes[j]
+    return distances
+
+#Hamming distance between pattern_codes and every window of codes
+def all_hamming_distances(codes, pattern_codes):
+    m = len(pattern_codes)
+    n = len(codes) - m + 1
+    distances = np.zeros(max(n, 0), dtype=np.int32)
+    for j in range(m):
+        distances += codes[j:j+n] != pattern_codes[j]
+    return distances
+
+#Starting positions of pattern in text with at most d mismatches, by comparing
+# every window. For a single query this beats seed-and-verify, which first has
+# to encode and sort the seeds of the whole text.
+def scan_approximate(text, pattern, d):
+    codes, pattern_codes = encode_dna(text), encode_dna(pattern)
+    if len(pattern_codes) > len(codes):
+        return []
+    distances = all_hamming_distances(codes, pattern_codes)
+    return np.flatnonzero(distances <= d).tolist()
+
+#Splits a pattern of length m into d+1 seeds, returns (offset, length) pairs.
+#Pigeonhole principle: with at most d mismatches at least one seed matches exactly.
+def split_seeds(m, d):
+    pieces = d + 1
+    bounds = [m * i // pieces for i in range(pieces + 1)]
+    return [(bounds[i], bounds[i+1] - bounds[i]) for i in range(pieces)]
+
+#Approximate pattern matching over one text, seed-and-verify.
+#The text is encoded once. Exact seed hits come from a sorted table of seed
+# codes (one per seed length, built on first use) or from a GenomeIndex when one
+# is given, and only the candidate windows they imply are verified.
+class ApproximateMatcher:
+
+    def __init__(self, text, index=None):
+        self.codes = encode_dna(text)
+        self.index = index
+        self._seed_tables = {}
+
+    #Returns (order, sorted codes) of all s-mers of the text
+    def _seed_table(self, s):
+        if s not in self._seed_tables:
+            seed_codes = compute_kmer_codes(self.codes, s)
+            order = np.argsort(seed_codes, kind="stable")
+            self._seed_tables[s] = (order, seed_codes[order])
+        return self._seed_tables[s]
+
+    #Starting positions of an exact seed in the text
+    def _seed_hits(self, seed):
+        if self.index is not None:
+            return np.asarray(self.index.find(seed), dtype=np.intp)
+        order, sorted_codes = self._seed_table(len(seed))
+        code = np.uint64(encode_kmer(seed))
+        lo = np.searchsorted(sorted_codes, code, side="left")
+        hi = np.searchsorted(sorted_codes, code, side="right")
+        return order[lo:hi]
+
+    #Candidate window starts: every seed hit shifted back by the seed offset
+    def _candidates(self, pattern, d):
+        m = len(pattern)
+        last = len(self.codes) - m
+        hits = []
+        for offset, length in split_seeds(m, d):
+            length = min(length, MAX_K) #A prefix of the seed still has to match
+            starts = self._seed_hits(pattern[offset:offset+length]) - offset
+            hits.append(starts[(starts >= 0) & (starts <= last)])
+        return np.unique(np.concatenate(hits))
+
+    #Starting positions of Pattern in the text with at most d mismatches
+    def find(self, pattern, d):
+        m = len(pattern)
+        pattern_codes = encode_dna(pattern)
+        if m == 0 or m > len(self.codes):
+            return list(range(len(self.codes) + 1)) if m == 0 else []
+        if m // (d + 1) < MIN_SEED:
+            return scan_approximate(self.codes, pattern_codes, d)
+        candidates = self._candidates(pattern, d)
+        distances = hamming_distances(self.codes, candidates, pattern_codes)
+        return candidates[distances <= d].tolist()
+
+    #Number of occurrences of Pattern in the text with at most d mismatches
+    def count(self, pattern, d):
+        return len(self.find(pattern, d))
+
+    #Batch versions: the seed tables are shared by all patterns
+    def find_all(self, patterns, d):
+        return {pattern: self.find(pattern, d) for pattern in patterns}
+
+    def count_all(self, patterns, d):
+        return {pattern: self.count(pattern, d) for pattern in patterns}
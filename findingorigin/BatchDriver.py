@@ -0,0 +1,220 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .FrequentWords import FindClumps, FrequentWords
+from .GenomeLoader import load_genome
+from .OriFinder import find_ori
+from .SkewArray import compute_skew_streaming, read_genome_chunks
+
+#Directory of the per-genome result cache
+CACHE_DIR = ".batch_cache"
+
+#Files picked up when the input is a directory
+GENOME_EXTENSIONS = (".txt", ".fa", ".fasta", ".seq")
+
+#Default parameters of the analyses
+PARAMETERS = {"k": 9, "d": 1, "window": 500, "clump_length": 500, "clump_times": 3}
+
+#Skew of the genome, read in chunks
+def analyze_skew(path, parameters):
+    tracker = compute_skew_streaming(read_genome_chunks(path))
+    return {
+        "length": tracker.length,
+        "final": tracker.skew,
+        "minimum": tracker.minimum,
+        "minimum_positions": tracker.minimum_positions,
+        "maximum": tracker.maximum,
+        "maximum_positions": tracker.maximum_positions,
+    }
+
+#Most frequent k-mers over both strands and the (L, t)-clumps of the whole genome
+def analyze_kmers(path, parameters):
+    codes = load_genome(path, cache=False).codes
+    k = parameters["k"]
+    return {
+        "frequent_words": FrequentWords(codes, k, canonical=True),
+        "clumps": FindClumps(codes, k, parameters["clump_length"], parameters["clump_times"]),
+    }
+
+#Motif search in the candidate ori windows: DnaA box candidates as the most
+# frequent k-mers with mismatches and reverse complements (see OriFinder.py)
+def analyze_motifs(path, parameters):
+    return find_ori(path, parameters["window"], parameters["k"], parameters["d"],
+                    parameters["clump_length"], parameters["clump_times"])
+
+#Analysis name -> (function(path, parameters), parameters its result depends on)
+ANALYSES = {
+    "skew": (analyze_skew, ()),
+    "kmers": (analyze_kmers, ("k", "clump_length", "clump_times")),
+    "motifs": (analyze_motifs, ("window", "k", "d", "clump_length", "clump_times")),
+}
+
+#Genome files of the inputs. A directory contributes its genome files (by
+# extension, sorted). A manifest (.list, .manifest or no extension) lists one
+# genome path per line, relative to the manifest; # starts a comment line.
+# Any other file is taken to be a genome.
+def collect_genomes(inputs):
+    genomes = []
+    for path in inputs:
+        if os.path.isdir(path):
+            genomes.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                           if name.endswith(GENOME_EXTENSIONS) and os.path.isfile(os.path.join(path, name)))
+        elif path.endswith((".list", ".manifest")) or os.path.splitext(path)[1] == "":
+            base = os.path.dirname(path)
+            with open(path) as manifest:
+                for line in manifest:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        genomes.append(os.path.join(base, line))
+        else:
+            genomes.append(path)
+    return genomes
+
+#SHA-256 of a file's content, read in chunks
+def content_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+#Cache key of one analysis of one genome: the content hash together with the
+# analysis and the parameters it depends on, so renamed or moved genomes still hit
+def cache_key(genome_hash, analysis, parameters):
+    used = {name: parameters[name] for name in ANALYSES[analysis][1]}
+    description = json.dumps([genome_hash, analysis, used], sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()
+
+def read_cache(cache_dir, key):
+    path = os.path.join(cache_dir, key + ".json")
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        return json.load(file)
+
+#Writes to a temporary file and renames it, so an interrupted run never leaves
+# a partial cache entry behind
+def write_cache(cache_dir, key, result):
+    descriptor, temporary = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w") as file:
+            json.dump(result, file)
+        os.replace(temporary, os.path.join(cache_dir, key + ".json"))
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+#Converts numpy values in a result to plain Python so it can be written as JSON
+def _plain(value):
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _run_analysis(analysis, path, parameters):
+    return _plain(ANALYSES[analysis][0](path, parameters))
+
+#Runs the analyses on every genome, one task per (genome, analysis) spread over
+# a process pool (workers=1 runs in the current process).
+#Each result is cached under cache_dir as soon as it finishes. Results already
+# in the cache are not recomputed, so a rerun with unchanged genomes and
+# parameters does no work and an interrupted run resumes where it stopped.
+#A task that raises gets {"error": message} as its result, which is not cached,
+# and the other tasks carry on.
+#Returns {genome path: {analysis: result}}
+def run_batch(genomes, analyses=tuple(ANALYSES), parameters=None, workers=None, cache_dir=CACHE_DIR, log=None):
+    parameters = dict(PARAMETERS, **(parameters or {}))
+    for analysis in analyses:
+        if analysis not in ANALYSES:
+            raise ValueError("Unknown analysis %r, expected one of %s" % (analysis, tuple(ANALYSES)))
+    os.makedirs(cache_dir, exist_ok=True)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    report = {path: {} for path in genomes}
+    tasks = []
+    for path in genomes:
+        genome_hash = content_hash(path)
+        for analysis in analyses:
+            key = cache_key(genome_hash, analysis, parameters)
+            cached = read_cache(cache_dir, key)
+            if cached is not None:
+                report[path][analysis] = cached
+            else:
+                tasks.append((path, analysis, key))
+    if log:
+        total = len(genomes) * len(analyses)
+        log("%d tasks, %d cached, %d to run" % (total, total - len(tasks), len(tasks)))
+
+    def finish(path, analysis, key, result):
+        write_cache(cache_dir, key, result)
+        report[path][analysis] = result
+        if log:
+            log("%s %s done" % (path, analysis))
+
+    def fail(path, analysis, error):
+        report[path][analysis] = {"error": "%s: %s" % (type(error).__name__, error)}
+        if log:
+            log("%s %s failed: %s" % (path, analysis, report[path][analysis]["error"]))
+
+    if workers == 1 or len(tasks) <= 1:
+        for path, analysis, key in tasks:
+            try:
+                result = _run_analysis(analysis, path, parameters)
+            except Exception as error:
+                fail(path, analysis, error)
+            else:
+                finish(path, analysis, key, result)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_run_analysis, analysis, path, parameters): (path, analysis, key)
+                       for path, analysis, key in tasks}
+            for future in as_completed(futures):
+                path, analysis, key = futures[future]
+                try:
+                    result = future.result()
+                except Exception as error:
+                    fail(path, analysis, error)
+                else:
+                    finish(path, analysis, key, result)
+
+    return {path: {analysis: report[path][analysis] for analysis in analyses} for path in genomes}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the skew, k-mer and motif analyses over many genomes")
+    parser.add_argument("inputs", nargs="+", help="genome files, directories of genomes or manifests")
+    parser.add_argument("--analyses", nargs="+", default=list(ANALYSES), choices=list(ANALYSES))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--output", help="JSON file for the report (default: standard output)")
+    for name, default in PARAMETERS.items():
+        parser.add_argument("--" + name.replace("_", "-"), type=int, default=default)
+    args = parser.parse_args(argv)
+
+    parameters = {name: getattr(args, name) for name in PARAMETERS}
+    report = run_batch(collect_genomes(args.inputs), args.analyses, parameters, args.workers, args.cache_dir,
+                       log=lambda message: print(message, file=sys.stderr))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    failed = any(isinstance(result, dict) and "error" in result
+                 for results in report.values() for result in results.values())
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from . import DATA_DIR, FrequentWords, GibbsSampling, PseudoScoringMotifs, ScoringMotifs, SkewArray
+
+#Bundled genomes, read from the package data whatever the working directory
+GENOMES = ["EColiGenome.txt", "VibrioCholeroGenome.txt"]
+
+#Times func() repeat times and returns (best seconds, peak traced memory in bytes).
+#Memory is measured on a separate run so tracing does not slow the timed ones.
+def measure(func, repeat):
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        seconds = min(seconds, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+#Random genome of the given length, reproducible from seed
+def synthetic_genome(length, seed):
+    rng = np.random.default_rng(seed)
+    return "".join(np.array(list("ACGT"))[rng.integers(0, 4, length)])
+
+#Random DNA strings for the motif searches: t strings of length n
+def synthetic_dna(t, n, seed):
+    return [synthetic_genome(n, seed + i) for i in range(t)]
+
+#(input name, genome) pairs: the bundled genomes and a synthetic one of scale Mb.
+#A missing bundled genome is an error, so reports always cover the same inputs.
+def genome_inputs(scale, seed):
+    inputs = []
+    for name in GENOMES:
+        path = os.path.join(DATA_DIR, name)
+        if not os.path.exists(path):
+            raise FileNotFoundError("Bundled genome %s is missing" % path)
+        with open(path) as file:
+            inputs.append((name, file.read()))
+    if scale > 0:
+        inputs.append(("synthetic-%gMb" % scale, synthetic_genome(int(scale * 1e6), seed)))
+    return inputs
+
+#(input name, dna, k) triples for the motif searches
+def motif_inputs(scale, seed):
+    inputs = [("DosR", ScoringMotifs.dna, 15)]
+    if scale > 0:
+        inputs.append(("synthetic-%dx500" % max(10, int(scale * 100)), synthetic_dna(max(10, int(scale * 100)), 500, seed), 15))
+    return inputs
+
+#Genome benchmarks: name -> function(genome), throughput in bases/s
+def genome_benchmarks():
+    return {
+        "FrequencyMap": lambda genome: FrequentWords.FrequencyMap(genome, 9),
+        "PatternMatchingIndex": lambda genome: FrequentWords.PatternMatchingIndex("ATGATCAAG", genome),
+        "compute_skew_array": lambda genome: SkewArray.compute_skew_array(genome),
+        "compute_approximate_pattern_matching":
+            lambda genome: SkewArray.compute_approximate_pattern_matching(genome, "ATGATCAAG", 1),
+    }
+
+#Motif benchmarks: name -> (work per call, unit, function(dna, k)).
+#The randomized searches run on one worker so their timings are comparable across machines.
+def motif_benchmarks(seed):
+    restarts = 20
+    gibbs_n = 20
+    return {
+        "search_greedy_motif": (1, "runs/s",
+                                lambda dna, k: ScoringMotifs.search_greedy_motif(dna, k, len(dna))),
+        "RepeatedRandomizedMotifSearch": (restarts, "restarts/s",
+                                          lambda dna, k: PseudoScoringMotifs.RepeatedRandomizedMotifSearch(
+                                              dna, k, len(dna), workers=1, seed=seed, N=restarts)),
+        "repeated_gibbs_sampler": (gibbs_n * gibbs_n, "iterations/s",
+                                   lambda dna, k: GibbsSampling.repeated_gibbs_sampler(
+                                       dna, k, len(dna), gibbs_n, workers=1, seed=seed)),
+    }
+
+#Runs the selected benchmarks and returns the JSON-ready report
+def run(scale=1.0, seed=0, repeat=3, only=None):
+    results = []
+
+    def record(name, input_name, size, work, unit, func):
+        if only and name not in only:
+            return
+        seconds, peak = measure(func, repeat)
+        results.append({
+            "name": name,
+            "input": input_name,
+            "size": size,
+            "seconds": seconds,
+            "throughput": work / seconds if seconds > 0 else float("inf"),
+            "unit": unit,
+            "peak_memory_bytes": peak,
+        })
+        print("%-40s %-22s %10.4fs %14.1f %s" % (name, input_name, seconds, results[-1]["throughput"], unit),
+              file=sys.stderr)
+
+    for input_name, genome in genome_inputs(scale, seed):
+        for name, func in genome_benchmarks().items():
+            record(name, input_name, len(genome), len(genome), "bases/s", lambda: func(genome))
+    for input_name, dna, k in motif_inputs(scale, seed):
+        for name, (work, unit, func) in motif_benchmarks(seed).items():
+            record(name, input_name, sum(map(len, dna)), work, unit, lambda: func(dna, k))
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "scale": scale,
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+#Compares two reports. A benchmark regresses when its time grows by more than
+# threshold (0.1 = 10%). Returns the rows of the comparison, whether any regressed
+# and the (name, input) pairs of the old report missing from the new one.
+def compare(old, new, threshold=0.1):
+    old_results = {(r["name"], r["input"]): r for r in old["results"]}
+    missing = sorted(set(old_results) - {(r["name"], r["input"]) for r in new["results"]})
+    rows = []
+    regressed = False
+    for result in new["results"]:
+        key = (result["name"], result["input"])
+        if key not in old_results:
+            continue
+        ratio = result["seconds"] / old_results[key]["seconds"]
+        memory_ratio = result["peak_memory_bytes"] / max(old_results[key]["peak_memory_bytes"], 1)
+        slower = ratio > 1 + threshold
+        regressed = regressed or slower
+        rows.append((key[0], key[1], ratio, memory_ratio, slower))
+    return rows, regressed, missing
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks of the ori-finding and motif-finding hot paths")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks and write a JSON report")
+    run_parser.add_argument("--output", default="benchmark.json")
+    run_parser.add_argument("--scale", type=float, default=1.0,
+                            help="size of the synthetic inputs (Mb of genome, x100 motif strings); 0 disables them")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--only", nargs="*", help="names of the benchmarks to run")
+    compare_parser = commands.add_parser("compare", help="compare two JSON reports")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run(args.scale, args.seed, args.repeat, args.only)
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        return 0
+
+    with open(args.old) as file:
+        old = json.load(file)
+    with open(args.new) as file:
+        new = json.load(file)
+    rows, regressed, missing = compare(old, new, args.threshold)
+    print("%-40s %-22s %8s %8s" % ("benchmark", "input", "time", "memory"))
+    for name, input_name, ratio, memory_ratio, slower in rows:
+        print("%-40s %-22s %7.2fx %7.2fx%s" % (name, input_name, ratio, memory_ratio, "  REGRESSION" if slower else ""))
+    for name, input_name in missing:
+        print("%-40s %-22s missing from %s" % (name, input_name, args.new), file=sys.stderr)
+    return 1 if regressed or missing else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
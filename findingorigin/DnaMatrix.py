@@ -0,0 +1,94 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .KmerCounting import decode_dna
+from .MotifProfile import encode_motifs
+
+#t DNA strings of equal length n held as one t x n uint8 array of 2-bit codes.
+#It is also a sequence of the strings: len(dna) is t and dna[i] decodes row i,
+# so the motif searches that take a list of strings accept it unchanged, while
+# encode_motifs (MotifProfile.py) and encode_dna hand the code array over without a copy.
+#The codes can live in a multiprocessing.shared_memory block (share()). A shared
+# matrix pickles as the name of its block, so a worker process receiving it
+# attaches to the same memory instead of getting a copy of the DNA.
+class DnaMatrix:
+
+    def __init__(self, codes, shm=None, owner=False):
+        self.codes = codes
+        self.shm = shm
+        self.owner = owner #Whether this process created the block and has to unlink it
+
+    #Encodes a list of equal-length DNA strings (or takes a t x n code array)
+    @classmethod
+    def from_sequences(cls, dna):
+        if isinstance(dna, DnaMatrix):
+            return dna
+        return cls(np.ascontiguousarray(encode_motifs(dna), dtype=np.uint8))
+
+    #Copies the codes into a new shared memory block and returns a DnaMatrix on it.
+    #The caller owns the block: close() it when done, which also frees it.
+    def share(self):
+        shm = shared_memory.SharedMemory(create=True, size=max(self.codes.nbytes, 1))
+        codes = np.ndarray(self.codes.shape, dtype=np.uint8, buffer=shm.buf)
+        codes[:] = self.codes
+        return DnaMatrix(codes, shm, owner=True)
+
+    #Attaches to the shared block name holding a matrix of the given shape (zero-copy).
+    #Meant for worker processes started by the creator, which share its resource
+    # tracker; only the creator frees the block.
+    @classmethod
+    def attach(cls, name, shape):
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(np.ndarray(shape, dtype=np.uint8, buffer=shm.buf), shm)
+
+    @property
+    def shared(self):
+        return self.shm is not None
+
+    def __reduce__(self):
+        if self.shared:
+            return DnaMatrix.attach, (self.shm.name, self.codes.shape)
+        return DnaMatrix, (self.codes,)
+
+    #Releases this process's view of the block, and frees the block if it was created here.
+    # Row views taken from the matrix must be dropped first.
+    def close(self):
+        if self.shm is None:
+            return
+        self.codes = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+        self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    def __len__(self):
+        return self.codes.shape[0]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [decode_dna(row) for row in self.codes[i]]
+        return decode_dna(self.codes[i])
+
+    def __iter__(self):
+        for row in self.codes:
+            yield decode_dna(row)
+
+    #Codes of row i as a view into the matrix
+    def row(self, i):
+        return self.codes[i]
+
+    #The k-mers starting at positions[r] in every row r, as strings
+    def kmers(self, positions, k):
+        windows = np.lib.stride_tricks.sliding_window_view(self.codes, k, axis=1)
+        return [decode_dna(window) for window in windows[np.arange(len(self)), positions]]
@@ -0,0 +1,68 @@
+import os
+import re
+
+import numpy as np
+
+from . import DATA_DIR
+from .KmerCounting import encode_dna, find_pattern_codes
+
+#Takes days - Do not do it
+def SymbolArray(Genome, symbol):
+    array = {}
+    n = len(Genome)
+    ExtendedGenome = Genome + Genome[0:n//2]
+    for i in range(n):
+        array[i] = PatternCount(symbol, ExtendedGenome[i:i+(n//2)])
+    return array
+
+#Counts of symbol in every circular window of half the genome length:
+# array[i] = occurrences of symbol in Genome[i:i+n//2], wrapping around the end.
+#Computed from one prefix sum of the symbol's occurrences, so no extended copy
+# of the genome and no dict are built. The result is a NumPy int32 array, or a
+# memory-mapped .npy file when out is a path.
+def FasterSymbolArray(Genome, symbol, out=None):
+    codes = encode_dna(Genome)
+    return _half_window_counts(codes == encode_dna(symbol)[0], out)
+
+#Circular half-genome window counts of all four nucleotides at once.
+#Returns a (4, n) int32 array whose rows are A, C, G, T.
+def compute_symbol_arrays(Genome, out=None):
+    codes = encode_dna(Genome)
+    n = len(codes)
+    if out is not None:
+        arrays = np.lib.format.open_memmap(out, mode="w+", dtype=np.int32, shape=(4, n))
+    else:
+        arrays = np.empty((4, n), dtype=np.int32)
+    for code in range(4):
+        _half_window_counts(codes == code, arrays[code])
+    return arrays
+
+#Window sums of the boolean array hits over [i, i+n//2) modulo n.
+#out may be an array to fill or a path for a memory-mapped .npy file.
+def _half_window_counts(hits, out=None):
+    n = len(hits)
+    h = n // 2
+    if isinstance(out, (str, os.PathLike)):
+        out = np.lib.format.open_memmap(out, mode="w+", dtype=np.int32, shape=(n,))
+    elif out is None:
+        out = np.empty(n, dtype=np.int32)
+    prefix = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(hits, dtype=np.int32, out=prefix[1:])
+    #Windows that end inside the genome
+    m = min(n - h + 1, n)
+    np.subtract(prefix[h:h+m], prefix[:m], out=out[:m])
+    #Windows that wrap around: the tail of the genome plus its first bases
+    out[m:] = prefix[n] - prefix[m:n] + prefix[1:n-m+1]
+    return out
+
+#A PackedGenome (or an array of codes) is searched on its codes.
+def PatternCount(Pattern, String):
+    if not isinstance(String, str):
+        return len(find_pattern_codes(Pattern, String))
+    return len(re.findall("(?=%s)"%Pattern, String))
+
+if __name__ == "__main__":
+    with open(os.path.join(DATA_DIR, 'EColiGenome.txt')) as file:
+        e_coli = file.read()
+
+    print(FasterSymbolArray(e_coli, 'C'))
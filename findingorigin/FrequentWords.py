@@ -0,0 +1,162 @@
+import re
+
+import numpy as np
+
+from .GenomeIndex import GenomeIndex
+from .KmerCounting import (compute_kmer_codes, count_canonical_kmers, count_kmers, count_kmers_with_mismatches,
+                          decode_kmers, find_pattern_codes, most_frequent_kmer_codes)
+
+#Strings made of the four upper case bases only, which can be counted on 2-bit codes
+_ACGT = re.compile("[ACGT]*")
+
+#Whether Text has to be counted as plain text: strings with lower case letters,
+# N or any other symbol keep their own k-mers as keys
+def _plain_text(Text):
+    return isinstance(Text, str) and _ACGT.fullmatch(Text) is None
+
+#k => k-mer
+#Counting is done on 2-bit integer codes (see KmerCounting.py), k-mers are
+# only decoded back to strings for the returned dictionary.
+#Text that is not upper case ACGT (N runs of an assembly, lower case masking)
+# is counted string by string instead, with the k-mers as they appear.
+#The dictionary keeps the order in which the k-mers first appear in Text.
+#With canonical=True a k-mer and its reverse complement share one entry, keyed by
+# whichever of the two comes first alphabetically, and both strands are counted.
+# This needs ACGT (either case), other characters raise a ValueError.
+def FrequencyMap(Text, k, canonical=False):
+    if not canonical and _plain_text(Text):
+        freq = {}
+        for i in range(len(Text)-k+1):
+            Pattern = Text[i:i+k]
+            freq[Pattern] = freq.get(Pattern, 0) + 1
+        return freq
+    if canonical:
+        distinct, counts, forward, reverse, first = count_canonical_kmers(Text, k)
+    else:
+        distinct, counts, first = count_kmers(Text, k)
+    order = np.argsort(first, kind="stable")
+    words = decode_kmers(distinct[order], k)
+    return dict(zip(words, counts[order].tolist()))
+
+#Canonical FrequencyMap with the counts split by strand:
+# Output: {canonical k-mer: (occurrences on the forward strand, occurrences on the reverse strand)}
+def StrandFrequencyMap(Text, k):
+    distinct, counts, forward, reverse, first = count_canonical_kmers(Text, k)
+    order = np.argsort(first, kind="stable")
+    words = decode_kmers(distinct[order], k)
+    return dict(zip(words, zip(forward[order].tolist(), reverse[order].tolist())))
+
+#Input: A string Text and an integer k
+#Output: A list containing all most frequent k-mers in Text
+#With canonical=True the counts cover both strands (see FrequencyMap).
+def FrequentWords(Text, k, canonical=False):
+    if not canonical and _plain_text(Text):
+        freq = FrequencyMap(Text, k)
+        if not freq:
+            return []
+        m = max(freq.values())
+        return [key for key in freq if freq[key] == m]
+    if not canonical:
+        codes, m = most_frequent_kmer_codes(Text, k)
+        return decode_kmers(codes, k)
+    distinct, counts, forward, reverse, first = count_canonical_kmers(Text, k)
+    if len(counts) == 0:
+        return []
+    top = np.flatnonzero(counts == counts.max())
+    return decode_kmers(distinct[top[np.argsort(first[top], kind="stable")]], k)
+
+#Input: A string Text, integers k and d
+#Output: All most frequent k-mers with up to d mismatches in Text
+#A k-mer Pattern is counted once for every window of Text within Hamming distance d
+# of it, so the returned k-mers need not appear in Text themselves.
+def FrequentWordsWithMismatches(Text, k, d):
+    patterns, counts = count_kmers_with_mismatches(Text, k, d)
+    if len(counts) == 0:
+        return []
+    return decode_kmers(patterns[counts == counts.max()], k)
+
+#Same as FrequentWordsWithMismatches, but the count of a k-mer also includes
+# the approximate occurrences of its reverse complement (both DNA strands).
+def FrequentWordsWithMismatchesAndReverseComplements(Text, k, d):
+    patterns, counts = count_kmers_with_mismatches(Text, k, d, reverse_complements=True)
+    if len(counts) == 0:
+        return []
+    return decode_kmers(patterns[counts == counts.max()], k)
+
+#Input: A string Text, integers k, L and t
+#Output: All distinct k-mers forming (L, t)-clumps in Text, in the order they are found
+#A k-mer forms an (L, t)-clump if it appears at least t times in some window of length L.
+#One count table is kept for the whole scan: when the window slides by one base
+# the k-mer leaving the window is decremented and the entering one incremented,
+# so the whole genome is covered in linear time.
+def FindClumps(Text, k, L, t):
+    kmer_codes = compute_kmer_codes(Text, k)
+    w = L - k + 1 #Number of k-mers in a window
+    if w <= 0 or len(kmer_codes) < w:
+        return []
+
+    #Relabel the k-mer codes as 0..m-1 so the count table is a flat list
+    distinct, ids = np.unique(kmer_codes, return_inverse=True)
+    ids = ids.tolist()
+    counts = [0] * len(distinct)
+    found = [False] * len(distinct)
+    clumps = []
+
+    for i in range(w): #First window
+        counts[ids[i]] += 1
+    for i in range(w):
+        kmer = ids[i]
+        if counts[kmer] >= t and not found[kmer]:
+            found[kmer] = True
+            clumps.append(kmer)
+
+    for i in range(w, len(ids)): #Sliding the window
+        counts[ids[i-w]] -= 1
+        kmer = ids[i]
+        counts[kmer] += 1
+        if counts[kmer] >= t and not found[kmer]:
+            found[kmer] = True
+            clumps.append(kmer)
+
+    return decode_kmers(distinct[clumps], k)
+
+#--------------Check these to improve------------
+#Returns starting position of Pattern in Genome as a list
+#Genome may also be a GenomeIndex, which answers without rescanning the genome.
+# Build it once with GenomeIndex.build(Genome) when many patterns are queried.
+#A PackedGenome (or an array of codes) is searched on its codes.
+def PatternMatchingIndex(Pattern, Genome):
+    if isinstance(Genome, GenomeIndex):
+        return Genome.find(Pattern)
+    if not isinstance(Genome, str):
+        return find_pattern_codes(Pattern, Genome).tolist()
+    positions = []
+    for i in range(len(Genome) - len(Pattern) + 1):
+        if Genome[i:i+len(Pattern)] == Pattern:
+            positions.append(i)
+    return positions
+
+#Pattern counting
+def PatternCount(Pattern, String):
+    if isinstance(String, GenomeIndex):
+        return String.count(Pattern)
+    if not isinstance(String, str):
+        return len(find_pattern_codes(Pattern, String))
+    return len(re.findall("(?=%s)"%Pattern, String))
+
+
+# Regex method
+# print the positions variable
+# print ([m.start() for m in re.finditer('(?='+ "CTTGATCAT" +')', v_cholerae)])
+
+#Regex to count the no. of occurences
+# Finally, print the sum of count_1 and count_2
+# print (len(re.findall('(?=' + "ATGATCAAG" + ')', Text)) + len(re.findall('(?=' + "CTTGATCAT" + ')', Text)))
+
+if __name__ == "__main__":
+    #OriC of Vibrio Cholero
+    Text = """ATCAATGATCAACGTAAGCTTCTAAGCATGATCAAGGTGCTCACACAGTTTATCCACAACCTGAGTGGATGACATCAAGATAGGTCGTTGTATCTCCTTCCTCTCGTACTCTCATGACCACGGAAAGATGATCAAGAGAGGATGATTTCTTGGCCATATCGCAATGAATACTTGTGACTTGTGCTTCCAATTGACATCTTCAGCGCCATATTGCGCTGGCCAAGGTGACGGAGCGGGATTACGAAAGCATGATCATGGCTGTTGTTCTGTTTATCTTGTTTTGACTGAGACTTGTTAGGATAGACGGTTTTTCATCACTGACTAGCCAAAGCCTTACTCTGCCTGACATCGACCGTAAATTGATAATGAATTTACATGCTTCCGCGACGATTTACCTCTTGATCATCGATCCGATTGAAGATCTTCAATTGTTAATTCTCTTGCCTCGACTCATAGCCATGATGAGCTCTTGATCATGTTTCCTTAACCCTCTATTTTTTACGGAAGAATGATCAAGCTGCTGCTCTTGATCATCGTTTC"""
+    k = 9
+    print(FrequentWords(Text, k))
+
+    print(FrequentWords("CGGAGGACTCTAGGTAACGCTTATCAGGTCCATAGGACATTCA", 3))
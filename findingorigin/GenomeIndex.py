@@ -0,0 +1,126 @@
+import os
+
+import numpy as np
+
+from .KmerCounting import encode_dna
+
+#Rows between two checkpoints of the occurrence table
+CHECKPOINT = 64
+
+#Length of the prefix used to rank the suffixes before the doubling rounds.
+# 27 symbols of a 5 letter alphabet still fit into an unsigned 64 bit integer.
+_INITIAL_PREFIX = 27
+
+#Builds the suffix array of a sequence of symbols 1..4 terminated by a 0 sentinel.
+#Prefix doubling: suffixes are first ranked by their first 27 symbols, then
+# each round sorts by (rank[i], rank[i+h]) which doubles the compared length,
+# until every suffix has its own rank. Repeats only cost extra rounds.
+def _build_suffix_array(text):
+    n = len(text)
+    h = min(_INITIAL_PREFIX, n)
+    key = np.zeros(n, dtype=np.uint64)
+    padded = np.concatenate([text, np.zeros(h, dtype=text.dtype)])
+    for j in range(h):
+        key *= np.uint64(5)
+        key += padded[j:j+n]
+    sa = np.argsort(key, kind="stable")
+    rank = np.empty(n, dtype=np.int64)
+    sorted_key = key[sa]
+    rank[sa] = np.concatenate([[0], np.cumsum(sorted_key[1:] != sorted_key[:-1])])
+
+    while rank[sa[-1]] < n - 1:
+        second = np.zeros(n, dtype=np.int64)
+        second[:n-h] = rank[h:] + 1
+        key = rank * (n + 1) + second
+        sa = np.argsort(key, kind="stable")
+        sorted_key = key[sa]
+        rank[sa] = np.concatenate([[0], np.cumsum(sorted_key[1:] != sorted_key[:-1])])
+        h *= 2
+    return sa
+
+#FM-index of a genome: suffix array, Burrows-Wheeler transform and a
+# checkpointed occurrence table. It is built once per genome; afterwards a
+# pattern of length m is counted with 2*m occurrence lookups, independent of the
+# genome length. The arrays can be saved to a directory of .npy files and
+# memory-mapped back, so later runs skip the build entirely.
+class GenomeIndex:
+
+    def __init__(self, sa, bwt, occ, first):
+        self.sa = sa #Suffix array (the sentinel suffix included)
+        self.bwt = bwt #Burrows-Wheeler transform, symbols 0 ($), 1 (A) .. 4 (T)
+        self.occ = occ #occ[j][c] = occurrences of c in bwt[0:j*CHECKPOINT]
+        self.first = first #first[c] = number of symbols smaller than c
+
+    #Length of the indexed genome (without the sentinel)
+    def __len__(self):
+        return len(self.sa) - 1
+
+    @classmethod
+    def build(cls, genome):
+        text = np.concatenate([encode_dna(genome) + 1, [0]]).astype(np.uint8)
+        sa = _build_suffix_array(text)
+        sa = sa.astype(np.int32 if len(text) < 2**31 else np.int64)
+        bwt = text[sa - 1]
+
+        #Pad the last block with a symbol that is never counted
+        padded = np.full(-(-len(bwt) // CHECKPOINT) * CHECKPOINT, 5, dtype=np.uint8)
+        padded[:len(bwt)] = bwt
+        blocks = padded.reshape(-1, CHECKPOINT)
+        occ = np.zeros((len(blocks) + 1, 5), dtype=np.int64)
+        for c in range(5):
+            np.cumsum(np.count_nonzero(blocks == c, axis=1), out=occ[1:, c])
+
+        totals = np.bincount(bwt, minlength=5)
+        first = np.concatenate([[0], np.cumsum(totals)[:-1]])
+        return cls(sa, bwt, occ.astype(sa.dtype), first)
+
+    #Saves the index as .npy files inside the directory path
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "sa.npy"), self.sa)
+        np.save(os.path.join(path, "bwt.npy"), self.bwt)
+        np.save(os.path.join(path, "occ.npy"), self.occ)
+        np.save(os.path.join(path, "first.npy"), self.first)
+
+    #Loads an index saved with save(). With mmap the arrays are mapped
+    # read-only instead of being read into memory.
+    @classmethod
+    def load(cls, path, mmap=True):
+        mode = "r" if mmap else None
+        arrays = [np.load(os.path.join(path, name + ".npy"), mmap_mode=mode)
+                  for name in ("sa", "bwt", "occ", "first")]
+        return cls(*arrays)
+
+    #Number of occurrences of symbol c in bwt[0:i]
+    def _rank(self, c, i):
+        block = i // CHECKPOINT
+        start = block * CHECKPOINT
+        return int(self.occ[block, c]) + int(np.count_nonzero(self.bwt[start:i] == c))
+
+    #Backward search: returns the suffix array interval [lo, hi) of Pattern
+    def _interval(self, pattern):
+        lo, hi = 0, len(self.sa)
+        for c in encode_dna(pattern)[::-1]:
+            c = int(c) + 1
+            lo = int(self.first[c]) + self._rank(c, lo)
+            hi = int(self.first[c]) + self._rank(c, hi)
+            if lo >= hi:
+                return 0, 0
+        return lo, hi
+
+    #Number of (possibly overlapping) occurrences of Pattern
+    def count(self, pattern):
+        lo, hi = self._interval(pattern)
+        return hi - lo
+
+    #Starting positions of Pattern in the genome, ascending
+    def find(self, pattern):
+        lo, hi = self._interval(pattern)
+        return np.sort(self.sa[lo:hi]).tolist()
+
+    #Batch versions: one entry per pattern
+    def count_all(self, patterns):
+        return {pattern: self.count(pattern) for pattern in patterns}
+
+    def find_all(self, patterns):
+        return {pattern: self.find(pattern) for pattern in patterns}
@@ -0,0 +1,158 @@
+import os
+
+import numpy as np
+
+from .KmerCounting import decode_dna, encode_dna
+
+#Suffix of the 2-bit packed cache written next to a genome text file
+SIDECAR_SUFFIX = ".2bit.npy"
+
+#Bytes at the start of the sidecar holding the number of bases
+_HEADER = 8
+
+_VALID = np.zeros(256, dtype=bool)
+for symbol in b"ACGTacgt":
+    _VALID[symbol] = True
+_LINE_BREAKS = np.zeros(256, dtype=bool)
+_LINE_BREAKS[[ord("\n"), ord("\r")]] = True
+
+#Memory-maps a genome text file as read-only bytes (an empty array for an empty file).
+#The map is the raw file, FASTA header lines included (see header_mask).
+def map_genome_file(path):
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+#(starts, ends) of the FASTA header lines in the bytes of a genome file: a '>'
+# at the start of a line, up to the line break
+def header_lines(data):
+    starts = np.flatnonzero(data == ord(">"))
+    starts = starts[(starts == 0) | (data[starts - 1] == ord("\n"))]
+    line_ends = np.append(np.flatnonzero(data == ord("\n")), len(data))
+    return starts, line_ends[np.searchsorted(line_ends, starts)]
+
+#Marks the bytes of the header lines, None when there are none
+def header_mask(data, lines=None):
+    starts, ends = header_lines(data) if lines is None else lines
+    if len(starts) == 0:
+        return None
+    edges = np.zeros(len(data) + 1, dtype=np.int32)
+    edges[starts] += 1
+    edges[ends] -= 1
+    return np.cumsum(edges[:-1]) > 0
+
+#Checks that a genome only contains A, C, G and T.
+# Input: the bytes of a genome file (a string, bytes or a mapped array)
+# Output:
+#     {'length': 1101766, 'line_breaks': 0, 'headers': 0, 'invalid': {}, 'first_invalid': None}
+# FASTA header lines are skipped, headers is their number. The records of a
+# multi-record FASTA file make up one genome, in file order.
+# invalid maps every other character to its number of occurrences.
+def validate_genome(data):
+    if isinstance(data, str):
+        data = data.encode("ascii", errors="replace")
+    data = np.frombuffer(data, dtype=np.uint8) if not isinstance(data, np.ndarray) else data
+    line_breaks = _LINE_BREAKS[data]
+    lines = header_lines(data)
+    headers = header_mask(data, lines)
+    skipped = line_breaks if headers is None else line_breaks | headers
+    invalid = np.flatnonzero(~_VALID[data] & ~skipped)
+    symbols, counts = np.unique(data[invalid], return_counts=True)
+    return {
+        "length": int(len(data) - np.count_nonzero(skipped)),
+        "line_breaks": int(np.count_nonzero(line_breaks)),
+        "headers": len(lines[0]),
+        "invalid": {chr(symbol): int(count) for symbol, count in zip(symbols, counts)},
+        "first_invalid": int(invalid[0]) if len(invalid) > 0 else None,
+    }
+
+# Input:
+#     array([2, 0, 3, 3, 0, 1, 0], dtype=uint8)  (GATTACA)
+# Output:
+#     array([143, 16], dtype=uint8)  (GATT, ACA padded with A)
+#Packs 2-bit codes four to a byte, the first base in the high bits
+def pack_codes(codes):
+    padded = np.zeros(-(-len(codes) // 4) * 4, dtype=np.uint8)
+    padded[:len(codes)] = codes
+    quads = padded.reshape(-1, 4)
+    return (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+
+#Inverse of pack_codes, length is the number of bases
+def unpack_codes(packed, length):
+    shifts = np.array([6, 4, 2, 0], dtype=np.uint8)
+    return ((packed[:, None] >> shifts) & 3).ravel()[:length]
+
+#A genome stored as 2-bit codes packed four bases to a byte.
+#The packed bytes may be a memory map of the sidecar file, so loading costs no
+# copy; codes unpacks them to one code per base the first time it is used and
+# keeps the result. The counting, skew and matching functions accept a
+# PackedGenome wherever they take a genome string.
+class PackedGenome:
+
+    def __init__(self, packed, length):
+        self.packed = packed
+        self.length = length
+        self._codes = None
+
+    @classmethod
+    def from_sequence(cls, genome):
+        codes = encode_dna(genome)
+        genome = cls(pack_codes(codes), len(codes))
+        genome._codes = codes
+        return genome
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def codes(self):
+        if self._codes is None:
+            self._codes = unpack_codes(self.packed, self.length)
+        return self._codes
+
+    def __str__(self):
+        return decode_dna(self.codes)
+
+    #Writes the sidecar file: an 8 byte length header followed by the packed bytes
+    def save(self, path):
+        header = np.frombuffer(np.array([self.length], dtype="<u8").tobytes(), dtype=np.uint8)
+        np.save(path, np.concatenate([header, self.packed]))
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path, mmap_mode="r")
+        length = int(np.frombuffer(data[:_HEADER].tobytes(), dtype="<u8")[0])
+        return cls(data[_HEADER:], length)
+
+#Loads a genome text file as a PackedGenome.
+#The first load maps the text file, validates it, drops line breaks and FASTA
+# header lines and writes
+# the packed sidecar (path + ".2bit.npy"). Later loads map the sidecar directly
+# as long as it is newer than the text file. Non-ACGT characters raise a ValueError.
+#When the sidecar cannot be written (a read-only genome directory, a full disk)
+# the genome is still returned, it is just packed again on the next load.
+def load_genome(path, cache=True):
+    sidecar = path + SIDECAR_SUFFIX
+    if cache and os.path.exists(sidecar) and os.path.getmtime(sidecar) >= os.path.getmtime(path):
+        return PackedGenome.load(sidecar)
+
+    data = map_genome_file(path)
+    report = validate_genome(data)
+    if report["invalid"]:
+        raise ValueError("%s: non-ACGT characters %s, first at byte %d"
+                         % (path, report["invalid"], report["first_invalid"]))
+    if report["headers"]:
+        data = data[~(_LINE_BREAKS[data] | header_mask(data))]
+    elif report["line_breaks"]:
+        data = data[~_LINE_BREAKS[data]]
+    genome = PackedGenome.from_sequence(data.tobytes())
+    if cache:
+        try:
+            genome.save(sidecar)
+        except OSError:
+            if os.path.exists(sidecar): #Never leave a partial sidecar behind
+                try:
+                    os.remove(sidecar)
+                except OSError:
+                    pass
+    return genome
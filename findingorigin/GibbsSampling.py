@@ -0,0 +1,309 @@
+import random
+
+import numpy as np
+
+from .KmerCounting import decode_dna, encode_dna
+from .MotifProfile import (Profile, background_frequencies, column_scores, count_motifs, encode_motifs,
+                          sample_profile_position, sample_profile_positions, score_motifs)
+from .ParallelRestarts import run_restarts
+
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Output:
+#     {'A': [2, 3, 2, 1, 1, 3],
+#      'C': [3, 2, 5, 3, 1, 1], 
+#      'T': [2, 2, 1, 2, 5, 3], 
+#      'G': [2, 2, 1, 3, 2, 2]}
+#Adding 1 to each element in the count matrix
+#Count-Matrix : No. of nucleotides in each column
+#Pseudo-Count-Matrix: No. of nucleodies plus 1 in each column.
+#                     Laplace's Rule of Succession: The proabability that sun may never rise tomorrow
+#The counting is one vectorized pass over the encoded motifs (MotifProfile.count_motifs).
+def get_pseudo_count_matrix(motifs):
+    return dict(zip("ACGT", count_motifs(motifs, pseudocount=1).tolist()))
+
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Output:
+#     {'A': [0.2222222222222222, 0.3333333333333333, 0.2222222222222222, 0.1111111111111111, 0.1111111111111111, 0.3333333333333333], 
+#      'C': [0.3333333333333333, 0.2222222222222222, 0.5555555555555556, 0.3333333333333333, 0.1111111111111111, 0.1111111111111111], 
+#      'T': [0.2222222222222222, 0.2222222222222222, 0.1111111111111111, 0.2222222222222222, 0.5555555555555556, 0.3333333333333333], 
+#      'G': [0.2222222222222222, 0.2222222222222222, 0.1111111111111111, 0.3333333333333333, 0.2222222222222222, 0.2222222222222222]}
+#Dividing each element in count matrix by (no. of items in each column + 4)
+#We are adding an extra 1 count to each group in the output (GCAT), not to each element in the motif.  
+#Returns a MotifProfile.Profile, which can be indexed like the dict above.
+def get_pseudo_profile_matrix(motifs):
+    return Profile.from_motifs(motifs, pseudocount=1)
+
+#t = len(dna)
+#k: k-mer
+#dna: list of strings dna
+#RandomMotifs
+#Generates random motifs (k-mers) from each DNA string
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Output:
+#     AA
+#     CG
+#     CT
+#     GA
+#     GG
+# Assuming k = 2
+def generate_random_motifs(dna,k,t):
+    random_kmers = []
+    for i in range(t):
+        r = random.randint(0,len(dna[0])-k)
+        random_kmers.append(dna[i][r:r+k])
+    return random_kmers
+
+# Takes the count matrix and prints out a string which has the most value in each column
+# If two nucleotides have same count number then a nucleotide is selected randomly. 
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Count Matrix:
+#     {'A': [2, 3, 2, 1, 1, 3],
+#      'C': [3, 2, 5, 3, 1, 1], 
+#      'T': [2, 2, 1, 2, 5, 3], 
+#      'G': [2, 2, 1, 3, 2, 2]}
+# Output:
+#  Consensus String:
+#   CACCTA
+#The consensus is the column argmax of the count matrix (MotifProfile.score_motifs),
+# which takes the first of A, C, G, T on ties like the loop it replaces.
+def get_consensus_string(motifs):
+    score, consensus, counts = score_motifs(motifs)
+    return consensus
+
+# Takes in the consensus string and computes how many nucleotides are off in each column
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Consensus String: CACCTA 
+# Output:
+#     3+3+1+3+1+3  
+#     14
+#Computed from the count matrix as t minus the column maximum, summed over the columns.
+# Callers that already hold the count matrix of the motifs (an array or a dict such as
+# get_count_matrix or get_pseudo_count_matrix return) can pass it and skip the counting.
+def compute_score(motifs, counts=None):
+    score, consensus, counts = score_motifs(motifs, counts)
+    return score
+
+#This function takes a dictionary Probabilities whose keys are k-mers and 
+# whose values are the probabilities of these k-mers (which do not necessarily 
+# sum to 1). The function should divide each value in Probabilities by the sum
+# of all values in  Probabilities, then return the resulting dictionary.
+# To make the sum of all probabilities equal to 1
+def normalize(probabilities):
+    sum_of_probabilites = 0
+    for key in probabilities:
+        sum_of_probabilites += probabilities[key]
+    for key in probabilities:
+        probabilities[key] = probabilities[key]/sum_of_probabilites
+    return probabilities
+
+#Probabilites are lined up as if they are in a straight line. 
+# A random num is generated and is compared against this straight line. 
+# The corresponding key is returned. 
+# In-short: A random motif is selected based on a weighted probability scale.  
+def weighted_die(probabilities):
+    random_num = random.uniform(0,1)
+    count = 0
+    for key in probabilities:
+        count += probabilities[key]
+        if random_num < count:
+            return key
+
+# Input:
+#     ACGGGGATTACC
+#     0.2 0.2 0.0 0.0 0.0 0.0 0.9 0.1 0.1 0.1 0.3 0.0
+#     0.1 0.6 0.0 0.0 0.0 0.0 0.0 0.4 0.1 0.2 0.4 0.6
+#     0.0 0.0 1.0 1.0 0.9 0.9 0.1 0.0 0.0 0.0 0.0 0.0
+#     0.7 0.2 0.0 0.0 0.1 0.1 0.0 0.5 0.8 0.7 0.3 0.4
+# Output:
+#     0.000839808
+# To implement a function Pr(Text, Profile), we begin by 
+# setting a “probability” variable p equal to 1. We then range
+# through the characters of Text one at a time. At position i of Text, 
+# we set p equal to p times the value of Profile corresponding to symbol
+# Text[i] and column i, which is just Profile[Text[i]][i].
+#The probability that a profile matrix will produce a given string is given by the product of individual nucleotide probabilities.
+#Computes probability of the k-mer occuring. 
+# Multiplies the probability of nucleotide in each column
+def compute_probability(text, profile_matrix):
+    probability = 1
+    for i in range(len(text)):
+        probability *= profile_matrix[text[i]][i]
+    return probability
+
+#Assemble this code into a function ProfileGeneratedString(Text, profile, k) that takes a string Text,
+#  a profile matrix profile , and an integer k as input.  
+# It should then return a randomly generated k-mer from Text whose probabilities are generated from profile, as described above.  
+# Computes a motif (k-mer) with the most probability based on a given proabability and a DNA String. 
+#Sample Input:
+# 1
+# AAACCCAAACCC
+# {'A': [0.5, 0.1], 
+#  'C': [0.3, 0.2], 
+#  'G': [0.2, 0.4], 
+#  'T': [0.0, 0.3]}
+# 2
+# Sample Output:
+# AC
+#All windows are scored as one vector and drawn by position with a cumulative sum
+# and searchsorted (MotifProfile.sample_profile_position), so a k-mer occurring
+# twice keeps the weight of both windows.
+def profile_generated_string(Text, profile_matrix,k):
+    i, k_mer = profile_generated_position(Text, profile_matrix, k)
+    return k_mer
+
+#Same as profile_generated_string, but returns (position, k-mer).
+#Text may also be a row of codes (DnaMatrix.row), the k-mer is still a string.
+def profile_generated_position(Text, profile_matrix, k):
+    i = sample_profile_position(Text, k, profile_matrix)
+    k_mer = Text[i:i+k]
+    if isinstance(k_mer, np.ndarray):
+        k_mer = decode_dna(k_mer)
+    return i, k_mer
+
+#Batched draw: size positions of Text for one profile, from the numpy Generator rng
+def profile_generated_positions(Text, profile_matrix, k, size, rng=None):
+    return sample_profile_positions(Text, k, profile_matrix, size, rng)
+
+#State of one Gibbs sampling chain: the motifs as a t x k code array together
+# with their count matrix, consensus and score (compute_score).
+#Replacing one motif only touches that row: its bases are taken out of the
+# counts and the new bases added, and the consensus and score are recomputed in
+# the columns where the two rows differ. Each step is O(k) instead of O(t*k).
+#objective and background select the score as in MotifProfile.column_scores.
+class GibbsState:
+
+    def __init__(self, motifs, objective="consensus", background=None):
+        self.motifs_array = encode_motifs(motifs).copy()
+        self.t, self.k = self.motifs_array.shape
+        self.objective = objective
+        self.background = background
+        self.columns = np.arange(self.k)
+        self.counts = count_motifs(self.motifs_array)
+        self.consensus = np.argmax(self.counts, axis=0)
+        self.column_scores = column_scores(self.counts, objective, background)
+        self.score = self.column_scores.sum()
+
+    #Pseudocount profile of every motif except row i (get_pseudo_profile_matrix)
+    def profile_without(self, i):
+        counts = self.counts.copy()
+        counts[self.motifs_array[i], self.columns] -= 1
+        return Profile.from_counts(counts + 1, self.t - 1 + 4)
+
+    #Replaces motif i and updates counts, consensus and score
+    def replace(self, i, motif):
+        old = self.motifs_array[i]
+        new = encode_dna(motif)
+        changed = np.flatnonzero(old != new)
+        if len(changed) == 0:
+            return
+        self.counts[old[changed], changed] -= 1
+        self.counts[new[changed], changed] += 1
+        self.motifs_array[i] = new
+        self.consensus[changed] = np.argmax(self.counts[:, changed], axis=0)
+        scores = column_scores(self.counts[:, changed], self.objective, self.background)
+        self.score += (scores - self.column_scores[changed]).sum()
+        self.column_scores[changed] = scores
+
+    @property
+    def motifs(self):
+        return [decode_dna(row) for row in self.motifs_array]
+
+# Generates a random motif at first
+# It is assigned as the best motif
+# In each iteration:
+# Delete a random row of motif.
+# Calculate pseudo profile matrix from the remaining motif
+# Generate the most probable motif based on weighted probability and replace the deleted motif
+# Compare the score, if the new motifs scores less then it is assigned as the best motif
+# If there were 10 rows then there would be 10 iterations
+#The motifs live in a GibbsState that keeps counts and score up to date, and the
+# best score is remembered instead of being recomputed every iteration.
+#objective selects the score to minimize (MotifProfile.OBJECTIVES); relative_entropy
+# uses background nucleotide frequencies, by default those of dna.
+def gibbs_sampler(dna,k,t,n,objective="consensus",background=None):
+    if objective == "relative_entropy" and background is None:
+        background = background_frequencies(dna)
+    state = GibbsState(generate_random_motifs(dna,k,t), objective, background)
+    best_motifs = state.motifs
+    best_score = state.score
+    for j in range(n):
+        i = random.randint(0,t-1)
+        profile_matrix = state.profile_without(i)
+        state.replace(i, profile_generated_string(dna[i], profile_matrix, k))
+        if state.score < best_score:
+            best_score = state.score
+            best_motifs = state.motifs
+    return best_motifs
+
+#Hyperlinked DosR dataset
+dna = ["GCGCCCCGCCCGGACAGCCATGCGCTAACCCTGGCTTCGATGGCGCCGGCTCAGTTAGGGCCGGAAGTCCCCAATGTGGCAGACCTTTCGCCCCTGGCGGACGAATGACCCCAGTGGCCGGGACTTCAGGCCCTATCGGAGGGCTCCGGCGCGGTGGTCGGATTTGTCTGTGGAGGTTACACCCCAATCGCAAGGATGCATTATGACCAGCGAGCTGAGCCTGGTCGCCACTGGAAAGGGGAGCAACATC",
+        "CCGATCGGCATCACTATCGGTCCTGCGGCCGCCCATAGCGCTATATCCGGCTGGTGAAATCAATTGACAACCTTCGACTTTGAGGTGGCCTACGGCGAGGACAAGCCAGGCAAGCCAGCTGCCTCAACGCGCGCCAGTACGGGTCCATCGACCCGCGGCCCACGGGTCAAACGACCCTAGTGTTCGCTACGACGTGGTCGTACCTTCGGCAGCAGATCAGCAATAGCACCCCGACTCGAGGAGGATCCCG",
+        "ACCGTCGATGTGCCCGGTCGCGCCGCGTCCACCTCGGTCATCGACCCCACGATGAGGACGCCATCGGCCGCGACCAAGCCCCGTGAAACTCTGACGGCGTGCTGGCCGGGCTGCGGCACCTGATCACCTTAGGGCACTTGGGCCACCACAACGGGCCGCCGGTCTCGACAGTGGCCACCACCACACAGGTGACTTCCGGCGGGACGTAAGTCCCTAACGCGTCGTTCCGCACGCGGTTAGCTTTGCTGCC",
+        "GGGTCAGGTATATTTATCGCACACTTGGGCACATGACACACAAGCGCCAGAATCCCGGACCGAACCGAGCACCGTGGGTGGGCAGCCTCCATACAGCGATGACCTGATCGATCATCGGCCAGGGCGCCGGGCTTCCAACCGTGGCCGTCTCAGTACCCAGCCTCATTGACCCTTCGACGCATCCACTGCGCGTAAGTCGGCTCAACCCTTTCAAACCGCTGGATTACCGACCGCAGAAAGGGGGCAGGAC",
+        "GTAGGTCAAACCGGGTGTACATACCCGCTCAATCGCCCAGCACTTCGGGCAGATCACCGGGTTTCCCCGGTATCACCAATACTGCCACCAAACACAGCAGGCGGGAAGGGGCGAAAGTCCCTTATCCGACAATAAAACTTCGCTTGTTCGACGCCCGGTTCACCCGATATGCACGGCGCCCAGCCATTCGTGACCGACGTCCCCAGCCCCAAGGCCGAACGACCCTAGGAGCCACGAGCAATTCACAGCG",
+        "CCGCTGGCGACGCTGTTCGCCGGCAGCGTGCGTGACGACTTCGAGCTGCCCGACTACACCTGGTGACCACCGCCGACGGGCACCTCTCCGCCAGGTAGGCACGGTTTGTCGCCGGCAATGTGACCTTTGGGCGCGGTCTTGAGGACCTTCGGCCCCACCCACGAGGCCGCCGCCGGCCGATCGTATGACGTGCAATGTACGCCATAGGGTGCGTGTTACGGCGATTACCTGAAGGCGGCGGTGGTCCGGA",
+        "GGCCAACTGCACCGCGCTCTTGATGACATCGGTGGTCACCATGGTGTCCGGCATGATCAACCTCCGCTGTTCGATATCACCCCGATCTTTCTGAACGGCGGTTGGCAGACAACAGGGTCAATGGTCCCCAAGTGGATCACCGACGGGCGCGGACAAATGGCCCGCGCTTCGGGGACTTCTGTCCCTAGCCCTGGCCACGATGGGCTGGTCGGATCAAAGGCATCCGTTTCCATCGATTAGGAGGCATCAA",
+        "GTACATGTCCAGAGCGAGCCTCAGCTTCTGCGCAGCGACGGAAACTGCCACACTCAAAGCCTACTGGGCGCACGTGTGGCAACGAGTCGATCCACACGAAATGCCGCCGTTGGGCCGCGGACTAGCCGAATTTTCCGGGTGGTGACACAGCCCACATTTGGCATGGGACTTTCGGCCCTGTCCGCGTCCGTGTCGGCCAGACAAGCTTTGGGCATTGGCCACAATCGGGCCACAATCGAAAGCCGAGCAG",
+        "GGCAGCTGTCGGCAACTGTAAGCCATTTCTGGGACTTTGCTGTGAAAAGCTGGGCGATGGTTGTGGACCTGGACGAGCCACCCGTGCGATAGGTGAGATTCATTCTCGCCCTGACGGGTTGCGTCTGTCATCGGTCGATAAGGACTAACGGCCCTCAGGTGGGGACCAACGCCCCTGGGAGATAGCGGTCCCCGCCAGTAACGTACCGCTGAACCGACGGGATGTATCCGCCCCAGCGAAGGAGACGGCG",
+        "TCAGCACCATGACCGCCTGGCCACCAATCGCCCGTAACAAGCGGGACGTCCGCGACGACGCGTGCGCTAGCGCCGTGGCGGTGACAACGACCAGATATGGTCCGAGCACGCGGGCGAACCTCGTGTTCTGGCCTCGGCCAGTTGTGTAGAGCTCATCGCTGTCATCGAGCGATATCCGACCACTGATCCAAGTCGGGGGCTCTGGGGACCGAAGTCCCCGGGCTCGGAGCTATCGGACCTCACGATCACC"]
+
+#setting up variables:
+#t : Number of strings in dna
+#k : k-mer
+#N : Number of times we want to do gibbs sampling
+t = 10
+k = 15
+N = 100
+
+#Calling gibbs sampling 100 times
+#Storing the least scoring (best) motif
+#With workers or seed set the restarts run through ParallelRestarts.run_restarts:
+# spread over a process pool, each with its own seed derived from seed, so the
+# result is reproducible whatever the number of workers.
+#With target_score the search stops once a restart scores target_score or less.
+def repeated_gibbs_sampler(dna,k,t,N,workers=None,seed=None,target_score=None):
+    if workers is not None or seed is not None:
+        best_score, best_motifs = run_restarts(gibbs_sampler, compute_score, dna, (k, t, N),
+                                               N, workers=workers, seed=seed or 0, target_score=target_score)
+        return best_motifs
+    best_score = float('inf')
+    best_motifs = []
+    for i in range(N):
+        motifs = gibbs_sampler(dna,k,t,N)
+        curr_score = compute_score(motifs)
+        if curr_score < best_score:
+            best_score = curr_score
+            best_motifs = motifs
+        if target_score is not None and curr_score <= target_score:
+            break
+    return best_motifs
+
+if __name__ == "__main__":
+    best_motifs = repeated_gibbs_sampler(dna,k,t,N)
+    print(best_motifs)
+    print(compute_score(best_motifs))
@@ -0,0 +1,274 @@
+import itertools
+
+import numpy as np
+
+#2-bit codes of the nucleotides. The order A < C < G < T keeps the integer
+# k-mer codes sorted in the same order as the k-mer strings.
+NUCLEOTIDES = "ACGT"
+
+#Largest k whose codes still fit into an unsigned 64 bit integer
+MAX_K = 31
+
+#Largest k for which we count with a dense bincount table (4^k entries)
+DENSE_K = 12
+
+#Number of (window, neighbour) pairs count_kmers_with_mismatches expands at once
+NEIGHBOUR_BLOCK = 1 << 18
+
+#The dense table is only used when its 4^k entries are at most this many times
+# the number of k-mers counted, so short sequences never pay for a 4^k table
+DENSE_FACTOR = 4
+
+#Maps every byte to its 2-bit code, 255 marks a non-ACGT byte
+_ENCODE_TABLE = np.full(256, 255, dtype=np.uint8)
+for code, symbol in enumerate(NUCLEOTIDES):
+    _ENCODE_TABLE[ord(symbol)] = code
+    _ENCODE_TABLE[ord(symbol.lower())] = code
+
+_DECODE_TABLE = np.frombuffer(NUCLEOTIDES.encode(), dtype=np.uint8)
+
+# Input:
+#     GATTACA
+# Output:
+#     array([2, 0, 3, 3, 0, 1, 0], dtype=uint8)
+#Packs a DNA string into one 2-bit code (0..3) per base.
+# Non-ACGT characters raise a ValueError with the offending position.
+#Arrays are taken to be codes already, and a PackedGenome (GenomeLoader.py)
+# hands over its unpacked codes, so every function built on encode_dna accepts both.
+def encode_dna(text):
+    if isinstance(text, np.ndarray):
+        return text
+    if hasattr(text, "codes"):
+        return text.codes
+    if isinstance(text, str):
+        text = text.encode("ascii")
+    codes = _ENCODE_TABLE[np.frombuffer(text, dtype=np.uint8)]
+    invalid = np.flatnonzero(codes == 255)
+    if len(invalid) > 0:
+        position = int(invalid[0])
+        raise ValueError("Non-ACGT character %r at position %d" % (chr(text[position]), position))
+    return codes
+
+# Input:
+#     array([2, 0, 3, 3, 0, 1, 0], dtype=uint8)
+# Output:
+#     GATTACA
+def decode_dna(codes):
+    return _DECODE_TABLE[codes].tobytes().decode("ascii")
+
+# Input:
+#     GAT
+# Output:
+#     35  (2*16 + 0*4 + 3)
+#Integer code of a single k-mer, the first base is the most significant.
+def encode_kmer(pattern):
+    code = 0
+    for value in encode_dna(pattern):
+        code = (code << 2) | int(value)
+    return code
+
+# Input:
+#     35, 3
+# Output:
+#     GAT
+def decode_kmer(code, k):
+    code = int(code)
+    symbols = []
+    for i in range(k):
+        symbols.append(NUCLEOTIDES[code & 3])
+        code >>= 2
+    return "".join(reversed(symbols))
+
+#Vectorized decode_kmer for an array of codes, returns a list of strings
+def decode_kmers(codes, k):
+    codes = np.asarray(codes, dtype=np.uint64)
+    shifts = np.arange(2*(k-1), -1, -2, dtype=np.uint64)
+    symbols = ((codes[:, None] >> shifts) & np.uint64(3)).astype(np.uint8)
+    rows = np.ascontiguousarray(_DECODE_TABLE[symbols]).view("S%d" % k).ravel()
+    return [row.decode("ascii") for row in rows]
+
+#Computes the integer code of every k-mer of the sequence at once.
+# Instead of slicing n-k+1 strings we shift the whole code array k times,
+# so the cost is k vectorized passes over the genome.
+def compute_kmer_codes(text, k):
+    if k < 1 or k > MAX_K:
+        raise ValueError("k must be between 1 and %d, got %d" % (MAX_K, k))
+    codes = encode_dna(text)
+    n = len(codes) - k + 1
+    if n <= 0:
+        return np.zeros(0, dtype=np.uint64)
+    kmer_codes = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        kmer_codes <<= np.uint64(2)
+        kmer_codes |= codes[j:j+n]
+    return kmer_codes
+
+#Start positions of an exact pattern in a sequence (codes, string or PackedGenome).
+#Patterns of up to MAX_K bases are compared as k-mer codes in one vectorized
+# pass; longer ones are matched on their first MAX_K bases and the candidates
+# checked against the rest of the pattern.
+def find_pattern_codes(pattern, text):
+    codes = encode_dna(text)
+    pattern = encode_dna(pattern)
+    m = len(pattern)
+    if m == 0:
+        return np.arange(len(codes) + 1)
+    if m > len(codes):
+        return np.zeros(0, dtype=np.intp)
+    head = min(m, MAX_K)
+    hits = np.flatnonzero(compute_kmer_codes(codes, head) == np.uint64(encode_kmer(pattern[:head])))
+    hits = hits[hits <= len(codes) - m]
+    if m > head:
+        hits = np.array([i for i in hits if np.array_equal(codes[i:i+m], pattern)], dtype=np.intp)
+    return hits
+
+#Counts every distinct k-mer of the sequence.
+#Returns (distinct codes sorted ascending, their counts, index of their first occurrence)
+# A dense bincount table is used when 4^k is small and comparable to the number
+# of k-mers (DENSE_K, DENSE_FACTOR); otherwise the codes are sorted with np.unique.
+def count_kmers(text, k):
+    kmer_codes = compute_kmer_codes(text, k)
+    if k <= DENSE_K and 4**k <= DENSE_FACTOR * len(kmer_codes):
+        indices = kmer_codes.astype(np.intp)
+        counts = np.bincount(indices, minlength=4**k)
+        distinct = np.flatnonzero(counts)
+        #The first occurrence of every code is the smallest position it appears at
+        first = np.full(4**k, len(indices), dtype=np.intp)
+        np.minimum.at(first, indices, np.arange(len(indices)))
+        return distinct.astype(np.uint64), counts[distinct], first[distinct]
+    distinct, first, counts = np.unique(kmer_codes, return_index=True, return_counts=True)
+    return distinct, counts, first
+
+#Returns the codes of the most frequent k-mers ordered by their first
+# appearance in the sequence, together with the maximum count.
+def most_frequent_kmer_codes(text, k):
+    distinct, counts, first = count_kmers(text, k)
+    if len(counts) == 0:
+        return [], 0
+    m = counts.max()
+    top = np.flatnonzero(counts == m)
+    top = top[np.argsort(first[top], kind="stable")]
+    return distinct[top], int(m)
+
+#Swaps that reverse the order of the 32 2-bit groups of a 64 bit integer:
+# neighbouring groups, then pairs of groups, nibbles of groups and so on.
+_GROUP_SWAPS = [(np.uint64(width), np.uint64(mask)) for width, mask in (
+    (2, 0x3333333333333333),
+    (4, 0x0F0F0F0F0F0F0F0F),
+    (8, 0x00FF00FF00FF00FF),
+    (16, 0x0000FFFF0000FFFF),
+    (32, 0x00000000FFFFFFFF),
+)]
+
+#Reverse complement of many k-mer codes at once.
+#Complementing a 2-bit code is x ^ 3 (A<->T, C<->G). The 2-bit groups are then
+# reversed with five swap steps over the whole 64 bit word, and shifted down so
+# the k groups of the k-mer end up in the low bits again.
+def reverse_complement_codes(codes, k):
+    codes = np.asarray(codes, dtype=np.uint64) ^ np.uint64(4**k - 1)
+    for width, mask in _GROUP_SWAPS:
+        codes = ((codes >> width) & mask) | ((codes & mask) << width)
+    return codes >> np.uint64(64 - 2*k)
+
+#Canonical code of every k-mer of the sequence: the smaller of the k-mer's code
+# and the code of its reverse complement, so a k-mer and its reverse complement
+# are counted as one. The reverse codes are derived from the forward codes in
+# the same pass, which covers both strands without scanning the reverse strand.
+#Returns (canonical codes, True where the forward strand gives the canonical code)
+def compute_canonical_kmer_codes(text, k):
+    forward = compute_kmer_codes(text, k)
+    reverse = reverse_complement_codes(forward, k)
+    on_forward = forward <= reverse
+    return np.where(on_forward, forward, reverse), on_forward
+
+#count_kmers over canonical k-mers with a per-strand breakdown.
+#Returns (distinct canonical codes, total counts, forward strand counts,
+# reverse strand counts, index of their first occurrence)
+#A palindromic k-mer (its own reverse complement) is counted on the forward strand.
+def count_canonical_kmers(text, k):
+    canonical, on_forward = compute_canonical_kmer_codes(text, k)
+    distinct, first, inverse = np.unique(canonical, return_index=True, return_inverse=True)
+    forward = np.bincount(inverse, weights=on_forward, minlength=len(distinct)).astype(np.int64)
+    totals = np.bincount(inverse, minlength=len(distinct))
+    return distinct, totals, forward, totals - forward, first
+
+#XOR masks that turn a k-mer code into each of its neighbours with 1..d
+# substitutions (0 is the k-mer itself). XORing a 2-bit group with 1, 2 or 3
+# always gives a different base, so every neighbour appears exactly once.
+def _neighbourhood_masks(k, d):
+    masks = [0]
+    for e in range(1, min(d, k) + 1):
+        for positions in itertools.combinations(range(k), e):
+            for values in itertools.product((1, 2, 3), repeat=e):
+                mask = 0
+                for p, value in zip(positions, values):
+                    mask |= value << 2*(k-1-p)
+                masks.append(mask)
+    return np.array(masks, dtype=np.uint64)
+
+#Counts, for every k-mer Pattern, the windows of the sequence within Hamming
+# distance d of Pattern. Instead of testing all 4^k patterns against the
+# sequence, every distinct window adds its count to each pattern of its
+# d-neighbourhood. With reverse_complements the count of each pattern is folded
+# with the count of its reverse complement.
+#The distinct windows are expanded NEIGHBOUR_BLOCK pairs at a time. For k <= 10
+# each block is added into one 4^k table; above that each block is reduced with
+# np.unique and merged into running totals, so the memory used depends on the
+# block size and the number of patterns found, not on windows x neighbourhood size.
+#Returns (pattern codes sorted ascending, their counts)
+def count_kmers_with_mismatches(text, k, d, reverse_complements=False):
+    distinct, counts, first = count_kmers(text, k)
+    if len(distinct) == 0:
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+    masks = _neighbourhood_masks(k, d)
+    rows = max(1, NEIGHBOUR_BLOCK // len(masks))
+    dense = k <= DENSE_K - 2
+    if dense:
+        totals = np.zeros(4**k, dtype=np.float64)
+    else:
+        merged = (np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64))
+        pending = []
+
+    for start in range(0, len(distinct), rows):
+        neighbour_codes = (distinct[start:start+rows, None] ^ masks[None, :]).ravel()
+        neighbour_counts = np.repeat(counts[start:start+rows], len(masks))
+        if reverse_complements:
+            #Every window also counts towards the reverse complements of its
+            # neighbours, which is the same as adding count(ReverseComplement(Pattern))
+            neighbour_codes = np.concatenate([neighbour_codes, reverse_complement_codes(neighbour_codes, k)])
+            neighbour_counts = np.concatenate([neighbour_counts, neighbour_counts])
+        if dense:
+            totals += np.bincount(neighbour_codes.astype(np.intp), weights=neighbour_counts, minlength=4**k)
+            continue
+        pending.append(_sum_by_code(neighbour_codes, neighbour_counts))
+        #Merge once the pending blocks reach a quarter of the running totals,
+        # which bounds both the pending memory and the number of rewrites
+        if sum(len(p) for p, c in pending) >= max(len(merged[0]) // 4, NEIGHBOUR_BLOCK):
+            merged = _merge_totals(merged, pending)
+            pending = []
+
+    if dense:
+        patterns = np.flatnonzero(totals)
+        return patterns.astype(np.uint64), totals[patterns].astype(np.int64)
+    return _merge_totals(merged, pending)
+
+#Sums counts per distinct code. Returns (codes sorted ascending, their totals)
+def _sum_by_code(codes, counts):
+    patterns, inverse = np.unique(codes, return_inverse=True)
+    return patterns, np.bincount(inverse, weights=counts, minlength=len(patterns)).astype(np.int64)
+
+#Adds the (codes, totals) pairs of parts into the running (codes, totals).
+#Codes already present are added in place; new ones are inserted at their
+# sorted positions, so the running arrays are never re-sorted.
+def _merge_totals(merged, parts):
+    if not parts:
+        return merged
+    new_patterns, new_totals = _sum_by_code(np.concatenate([p for p, c in parts]),
+                                            np.concatenate([c for p, c in parts]))
+    patterns, totals = merged
+    at = np.searchsorted(patterns, new_patterns)
+    found = at < len(patterns)
+    found[found] = patterns[at[found]] == new_patterns[found]
+    totals[at[found]] += new_totals[found]
+    return (np.insert(patterns, at[~found], new_patterns[~found]),
+            np.insert(totals, at[~found], new_totals[~found]))
@@ -0,0 +1,63 @@
+import numpy as np
+
+from .KmerCounting import decode_dna
+from .MotifProfile import encode_motifs
+
+# Input:
+#     3
+#     AAATTGACGCAT
+#     GACGACCACGTT
+#     CGTCAGCGCCTG
+#     GCTGAGCACCGG
+#     AGTTCGGGACAG
+# Output:
+#     ('GAC', 2)
+#Exact median string: the k-mer Pattern minimizing d(Pattern, Dna), the sum over
+# the (equal-length) DNA strings of the smallest Hamming distance between Pattern and any window
+# of the string.
+#Patterns are built one base at a time, depth first. For a prefix the partial
+# distance (mismatches in the first l columns of every window, minimized per
+# string and summed) never exceeds the distance of any pattern extending it, so
+# a prefix whose partial distance already reaches the best complete distance is
+# pruned with its whole subtree. The partial distances of all windows of all
+# strings are updated together with one comparison per added base.
+#Children are visited in order of their bound so good patterns are found early.
+#When several patterns share the minimum distance the first one found is returned.
+def median_string(dna, k):
+    dna_array = encode_motifs(dna)
+    t, n = dna_array.shape
+    windows = np.lib.stride_tricks.sliding_window_view(dna_array, k, axis=1) #t x (n-k+1) x k
+    best = [k * t + 1, None]
+
+    def extend(prefix, partial):
+        depth = len(prefix)
+        if depth == k:
+            distance = int(partial.min(axis=1).sum())
+            if distance < best[0]:
+                best[0], best[1] = distance, list(prefix)
+            return
+        column = windows[:, :, depth]
+        children = []
+        for code in range(4):
+            child = partial + (column != code)
+            bound = int(child.min(axis=1).sum())
+            if bound < best[0]:
+                children.append((bound, code, child))
+        for bound, code, child in sorted(children, key=lambda c: (c[0], c[1])):
+            if bound < best[0]:
+                prefix.append(code)
+                extend(prefix, child)
+                prefix.pop()
+
+    extend([], np.zeros(windows.shape[:2], dtype=np.int16))
+    return decode_dna(np.array(best[1], dtype=np.uint8)), best[0]
+
+#Motifs of the median string: the window of each DNA string closest to it
+# (the first one on ties), for comparing with the stochastic searches
+def median_string_motifs(dna, k):
+    pattern, distance = median_string(dna, k)
+    dna_array = encode_motifs(dna)
+    windows = np.lib.stride_tricks.sliding_window_view(dna_array, k, axis=1)
+    distances = (windows != encode_motifs([pattern])[0]).sum(axis=2)
+    positions = np.argmin(distances, axis=1)
+    return [decode_dna(windows[r, p]) for r, p in enumerate(positions)]
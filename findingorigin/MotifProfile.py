@@ -0,0 +1,233 @@
+import random
+
+import numpy as np
+
+from .KmerCounting import NUCLEOTIDES, decode_dna, encode_dna
+
+# Input:
+#     ['AACGTA', 'CCCGTT']
+# Output:
+#     array([[0, 0, 1, 2, 3, 0],
+#            [1, 1, 1, 2, 3, 3]], dtype=uint8)
+#Encodes a list of equal-length motifs as a t x k array of 2-bit codes.
+# A 2-D array is taken to be encoded already, and a DnaMatrix (DnaMatrix.py)
+# hands over its code array.
+def encode_motifs(motifs):
+    if isinstance(motifs, np.ndarray):
+        return motifs
+    if hasattr(motifs, "codes"):
+        return motifs.codes
+    k = len(motifs[0])
+    if any(len(motif) != k for motif in motifs):
+        raise ValueError("All motifs must have the same length")
+    return encode_dna("".join(motifs)).reshape(len(motifs), k)
+
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Output:
+#     array([[1, 2, 1, 0, 0, 2],
+#            [2, 1, 4, 2, 0, 0],
+#            [1, 1, 0, 2, 1, 1],
+#            [1, 1, 0, 1, 4, 2]])
+#4 x k count matrix (rows A, C, G, T) of the motifs plus pseudocount in every cell.
+#One bincount over code + 4*column counts all cells at once.
+def count_motifs(motifs, pseudocount=0):
+    motif_array = encode_motifs(motifs)
+    t, k = motif_array.shape
+    cells = motif_array.astype(np.intp) + 4 * np.arange(k)
+    counts = np.bincount(cells.ravel(), minlength=4*k).reshape(k, 4).T
+    return counts + pseudocount
+
+#Consensus of a 4 x k count matrix as codes: the most frequent base of every
+# column, the first of A, C, G, T on ties
+def consensus_codes(counts):
+    return np.argmax(counts, axis=0)
+
+#4 x k array of a count matrix given as an array or as a dict ({'A': [...], ...},
+# as get_count_matrix and get_pseudo_count_matrix return it)
+def as_counts(counts):
+    if isinstance(counts, dict):
+        return np.array([counts[symbol] for symbol in NUCLEOTIDES])
+    return np.asarray(counts)
+
+#Score of t motifs counted in a 4 x k count matrix: the number of bases that
+# differ from the consensus, which is t minus the column maximum summed over the
+# columns. O(k) for callers that hold the counts.
+#A pseudocount added to every cell is recognized from the column sums (t + 4 *
+# pseudocount) and taken off; a matrix whose columns do not sum alike is not
+# the count matrix of t motifs and raises a ValueError. Without t, the counts
+# are taken to have no pseudocount.
+def score_counts(counts, t=None):
+    counts = as_counts(counts)
+    totals = counts.sum(axis=0)
+    if t is None:
+        t = totals[0] if len(totals) else 0
+    pseudocounts = (totals - t) / 4
+    if np.any(pseudocounts != pseudocounts[:1]) or np.any(pseudocounts < 0):
+        raise ValueError("Not the count matrix of %d motifs: column sums %s" % (t, totals.tolist()))
+    return int(round(t * counts.shape[1] - (counts.max(axis=0) - pseudocounts).sum()))
+
+#Counts, consensus and score of the motifs in one vectorized pass.
+#counts may be their count matrix, with or without pseudocounts (see score_counts).
+#Returns (score, consensus string, 4 x k count matrix)
+def score_motifs(motifs, counts=None):
+    if counts is None:
+        counts = count_motifs(motifs)
+    counts = as_counts(counts)
+    return score_counts(counts, len(motifs)), decode_dna(consensus_codes(counts)), counts
+
+#Objectives the motif searches can minimize:
+# consensus        - compute_score, bases differing from the consensus
+# entropy          - sum of the column entropies (bits) of the motifs
+# relative_entropy - minus the information content: the sum of the columns'
+#                    relative entropy to the background nucleotide frequencies
+OBJECTIVES = ("consensus", "entropy", "relative_entropy")
+
+#Nucleotide frequencies (A, C, G, T) of a genome, a list of DNA strings or a DnaMatrix
+def background_frequencies(genome):
+    if isinstance(genome, (list, tuple)):
+        genome = "".join(genome)
+    codes = encode_dna(genome).ravel()
+    return np.bincount(codes, minlength=4) / len(codes)
+
+#Per-column scores of a 4 x k count matrix under an objective, lower is better.
+#Columns are independent, so callers that change one motif only need to
+# rescore the columns it touched. background is needed for relative_entropy.
+#A stack of count matrices (... x 4 x k) is scored matrix by matrix.
+def column_scores(counts, objective="consensus", background=None):
+    counts = np.asarray(counts)
+    if objective == "consensus":
+        return counts.sum(axis=-2) - counts.max(axis=-2)
+    if objective not in OBJECTIVES:
+        raise ValueError("Unknown objective %r, expected one of %s" % (objective, OBJECTIVES))
+    p = counts / counts.sum(axis=-2, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if objective == "entropy":
+            terms = -p * np.log2(p)
+        else:
+            terms = -p * np.log2(p / np.asarray(background, dtype=np.float64)[:, None])
+    return np.where(p > 0, terms, 0.0).sum(axis=-2)
+
+#Total score of the motifs under an objective (compute_score for consensus)
+def score_with_objective(motifs, objective="consensus", background=None):
+    scores = column_scores(count_motifs(motifs), objective, background)
+    return int(scores.sum()) if objective == "consensus" else float(scores.sum())
+
+#A profile matrix held as a 4 x k float64 array, rows A, C, G, T.
+#It is also the dict profile used across the motif modules ({'A': [...], ...}),
+# so profile['A'][j] and every other dict-based caller keep working at plain
+# dict speed. The dict rows are built once from the array; treat both as read-only.
+class Profile(dict):
+
+    def __init__(self, matrix):
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+        self._log = None
+        super().__init__(zip(NUCLEOTIDES, self.matrix.tolist()))
+
+    #Profile of the motifs: (count + pseudocount) / (t + 4*pseudocount)
+    @classmethod
+    def from_motifs(cls, motifs, pseudocount=0):
+        motif_array = encode_motifs(motifs)
+        return cls.from_counts(count_motifs(motif_array, pseudocount), len(motif_array) + 4*pseudocount)
+
+    #Profile of a count matrix whose columns each sum to total
+    @classmethod
+    def from_counts(cls, counts, total):
+        return cls(counts / total)
+
+    @property
+    def k(self):
+        return self.matrix.shape[1]
+
+    #Natural log of the matrix, computed once; log(0) is -inf
+    @property
+    def log(self):
+        if self._log is None:
+            with np.errstate(divide="ignore"):
+                self._log = np.log(self.matrix)
+        return self._log
+
+    def to_dict(self):
+        return {symbol: list(row) for symbol, row in self.items()}
+
+#Accepts either a dict profile ({'A': [...], ...}) or a Profile and returns a Profile
+def as_profile(profile_matrix):
+    if isinstance(profile_matrix, Profile):
+        return profile_matrix
+    return Profile([profile_matrix[symbol] for symbol in NUCLEOTIDES])
+
+#Log-probability of every k-mer window of an encoded sequence under a log-profile.
+#The windows are a strided view of the codes (no copies); the profile values of
+# all windows are gathered at once and summed across the columns.
+def score_windows(codes, log_profile):
+    k = log_profile.shape[1]
+    windows = np.lib.stride_tricks.sliding_window_view(codes, k, axis=-1)
+    return log_profile[windows, np.arange(k)].sum(axis=-1)
+
+#Relative tolerance under which two log scores count as a tie. Sums of logs
+# round differently than the products they stand for, so k-mers with exactly
+# equal probability can differ in the last bits of their log scores.
+TIE_TOLERANCE = 1e-9
+
+#Index of the first score within TIE_TOLERANCE of the maximum along the last axis.
+# When every score is -inf (probability 0) that is the first index.
+def first_max(scores):
+    best = scores.max(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore"):
+        threshold = best - TIE_TOLERANCE * np.maximum(np.abs(best), 1)
+    threshold = np.where(np.isfinite(best), threshold, best)
+    return np.argmax(scores >= threshold, axis=-1)
+
+#Position of the profile-most probable k-mer of text.
+#Ties go to the first window, as in compute_profile_most_probable_kmer; when every
+# window has probability 0 the first window is returned.
+def most_probable_kmer_position(text, k, profile_matrix):
+    log_profile = as_profile(profile_matrix).log[:, :k]
+    return int(first_max(score_windows(encode_dna(text), log_profile)))
+
+#Batched most_probable_kmer_position: scores all t DNA strings against one
+# profile in one call. dna is a list of equal-length strings or a t x n code array.
+#Returns an array of t window positions.
+def most_probable_kmer_positions(dna, k, profile_matrix):
+    log_profile = as_profile(profile_matrix).log[:, :k]
+    return first_max(score_windows(encode_motifs(dna), log_profile))
+
+#Probability of every k-mer window of text under the profile, as one vector
+def window_probabilities(text, k, profile_matrix):
+    matrix = as_profile(profile_matrix).matrix[:, :k]
+    windows = np.lib.stride_tricks.sliding_window_view(encode_dna(text), k, axis=-1)
+    return matrix[windows, np.arange(k)].prod(axis=-1)
+
+#Cumulative distribution over the windows of text, normalized in place.
+# Windows keep their own probability even when the same k-mer occurs twice.
+# If every window has probability 0 they are drawn uniformly.
+def _window_distribution(text, k, profile_matrix):
+    weights = window_probabilities(text, k, profile_matrix)
+    total = weights.sum()
+    if total > 0:
+        weights /= total
+    else:
+        weights[:] = 1 / len(weights)
+    return np.cumsum(weights, out=weights)
+
+#Draws one window position of text with probability proportional to its profile
+# probability. u is a uniform number in [0, 1), by default from the random module
+# so random.seed() still controls the draw.
+def sample_profile_position(text, k, profile_matrix, u=None):
+    cumulative = _window_distribution(text, k, profile_matrix)
+    if u is None:
+        u = random.random()
+    return min(int(np.searchsorted(cumulative, u, side="right")), len(cumulative) - 1)
+
+#Draws size window positions at once from a numpy Generator (default_rng() when
+# rng is None), for samplers that run several chains on the same profile
+def sample_profile_positions(text, k, profile_matrix, size, rng=None):
+    cumulative = _window_distribution(text, k, profile_matrix)
+    if rng is None:
+        rng = np.random.default_rng()
+    positions = np.searchsorted(cumulative, rng.random(size), side="right")
+    return np.minimum(positions, len(cumulative) - 1)
@@ -0,0 +1,88 @@
+import numpy as np
+
+from .KmerCounting import decode_dna
+from .MotifProfile import encode_motifs
+
+#Runs many Gibbs sampling chains in lockstep over one encoded t x n DNA array.
+#Every iteration each active chain drops one random motif, builds the
+# pseudocount profile of the rest from its count matrix, draws a replacement
+# window of that DNA string with probability proportional to the profile and
+# adds it back. All chains do this together in array operations.
+#A chain stops once its best score has not improved for patience iterations
+# (it has plateaued), so stuck and converged chains stop using compute while the
+# others continue, up to max_iterations.
+# Output:
+#     {'motifs': best motifs over all chains, 'score': their score,
+#      'chain_scores': best score of each chain, 'chain_iterations': iterations run by each chain,
+#      'converged': True for chains stopped by the plateau rule,
+#      'total_iterations': sum of chain_iterations,
+#      'trajectories': chains x iterations array of scores (-1 once a chain has stopped)}
+def run_gibbs_chains(dna, k, chains=20, max_iterations=1000, patience=100, seed=None, pseudocount=1):
+    dna_array = encode_motifs(dna)
+    t, n = dna_array.shape
+    rng = np.random.default_rng(seed)
+    columns = np.arange(k)
+    windows = np.lib.stride_tricks.sliding_window_view(dna_array, k, axis=1) #t x (n-k+1) x k
+    rows = np.arange(t)
+
+    positions = rng.integers(0, n - k + 1, size=(chains, t))
+    motifs = windows[rows, positions] #chains x t x k
+    counts = np.zeros((chains, 4, k), dtype=np.int64)
+    for c in range(4):
+        counts[:, c, :] = (motifs == c).sum(axis=1)
+    scores = t*k - counts.max(axis=1).sum(axis=1)
+
+    best_scores = scores.copy()
+    best_positions = positions.copy()
+    last_improvement = np.zeros(chains, dtype=np.int64)
+    iterations = np.zeros(chains, dtype=np.int64)
+    active = np.ones(chains, dtype=bool)
+    trajectories = np.full((chains, max_iterations), -1, dtype=np.int64)
+
+    for step in range(max_iterations):
+        chain = np.flatnonzero(active)
+        if len(chain) == 0:
+            break
+        i = rng.integers(0, t, size=len(chain))
+
+        #Take the dropped motif out of the counts and build the profiles
+        removed = motifs[chain, i]
+        counts[chain[:, None], removed, columns] -= 1
+        profiles = (counts[chain] + pseudocount) / (t - 1 + 4*pseudocount)
+
+        #Probability of every window of the dropped string, per chain
+        chain_windows = windows[i] #active x (n-k+1) x k
+        weights = profiles[np.arange(len(chain))[:, None, None], chain_windows, columns].prod(axis=-1)
+        cumulative = np.cumsum(weights, axis=1)
+        #A string whose windows all have probability 0 (pseudocount=0) is drawn
+        # uniformly, as in MotifProfile._window_distribution
+        cumulative[cumulative[:, -1] == 0] = np.arange(1, n - k + 2)
+        u = rng.random(len(chain)) * cumulative[:, -1]
+        new_positions = np.minimum((cumulative <= u[:, None]).sum(axis=1), n - k)
+
+        added = chain_windows[np.arange(len(chain)), new_positions]
+        counts[chain[:, None], added, columns] += 1
+        motifs[chain, i] = added
+        positions[chain, i] = new_positions
+        scores[chain] = t*k - counts[chain].max(axis=1).sum(axis=1)
+
+        improved = scores[chain] < best_scores[chain]
+        better = chain[improved]
+        best_scores[better] = scores[better]
+        best_positions[better] = positions[better]
+        last_improvement[better] = step
+        iterations[chain] += 1
+        trajectories[chain, step] = scores[chain]
+        active[chain[step - last_improvement[chain] >= patience]] = False
+
+    best = int(np.argmin(best_scores))
+    best_motifs = [decode_dna(dna_array[r, p:p+k]) for r, p in enumerate(best_positions[best])]
+    return {
+        "motifs": best_motifs,
+        "score": int(best_scores[best]),
+        "chain_scores": best_scores.tolist(),
+        "chain_iterations": iterations.tolist(),
+        "converged": (~active).tolist(),
+        "total_iterations": int(iterations.sum()),
+        "trajectories": trajectories[:, :int(iterations.max(initial=0))],
+    }
@@ -0,0 +1,139 @@
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from .FrequentWords import FindClumps
+from .KmerCounting import count_kmers_with_mismatches, decode_dna, decode_kmers, encode_dna
+from .SkewArray import SkewTracker, read_genome_chunks
+
+#Default parameters of the search, as used for the V. cholerae and T. petrophila ori
+WINDOW = 500
+K = 9
+D = 1
+CLUMP_TIMES = 3
+
+#Reads a genome in one pass: every chunk is encoded once, fed to a SkewTracker
+# and kept, so the skew and the encoded genome come out of the same read.
+#genome is a file path, a DNA string or a PackedGenome.
+#Returns (2-bit codes of the genome, SkewTracker)
+def scan_genome(genome):
+    tracker = SkewTracker()
+    if isinstance(genome, str) and os.path.isfile(genome):
+        pieces = []
+        for chunk in read_genome_chunks(genome):
+            codes = encode_dna(chunk)
+            tracker.update(codes)
+            pieces.append(codes)
+        codes = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.uint8)
+    else:
+        codes = encode_dna(genome)
+        tracker.update(codes)
+    return codes, tracker
+
+#Groups the minimum skew positions into candidate ori windows of length window.
+#Positions closer than half a window share one candidate, centered between the
+# first and last position of the group. The genome is circular, so a run of
+# positions crossing the origin (position length is position 0 again) is one
+# group, listed in genome order from its end before the origin, and windows
+# near either end wrap around.
+#Returns a list of (start, positions of the group)
+def candidate_windows(positions, length, window=WINDOW):
+    groups = []
+    for position in sorted(positions):
+        if groups and position - groups[-1][-1] <= window // 2:
+            groups[-1].append(position)
+        else:
+            groups.append([position])
+    #Bounds of each group, the first position of a wrapped group shifted back by length
+    bounds = [(group[0], group[-1]) for group in groups]
+    if len(groups) > 1 and groups[0][0] + length - groups[-1][-1] <= window // 2:
+        bounds[0] = (groups[-1][0] - length, groups[0][-1])
+        groups[0] = groups.pop() + groups[0]
+        bounds.pop()
+    return [(((first + last) // 2 - window // 2) % max(length, 1), group)
+            for (first, last), group in zip(bounds, groups)]
+
+#Codes of the window of the circular genome starting at start
+def window_codes(codes, start, window=WINDOW):
+    if start + window <= len(codes):
+        return codes[start:start+window]
+    return np.take(codes, np.arange(start, start + window), mode="wrap")
+
+#Analysis of one candidate window: the most frequent k-mers with up to d
+# mismatches counted on both strands, and the (L, t)-clumps of the window
+def analyze_window(codes, k=K, d=D, clump_length=None, clump_times=CLUMP_TIMES):
+    if clump_length is None:
+        clump_length = len(codes)
+    patterns, counts = count_kmers_with_mismatches(codes, k, d, reverse_complements=True)
+    if len(counts) == 0:
+        words, count = [], 0
+    else:
+        count = int(counts.max())
+        words = decode_kmers(patterns[counts == count], k)
+    return {
+        "frequent_words": words,
+        "count": count,
+        "clumps": FindClumps(codes, k, clump_length, clump_times),
+    }
+
+#Whole ori-finding pipeline for one genome (file path, DNA string or PackedGenome):
+# skew in a single streamed pass, candidate windows around the skew minimum and
+# frequent words with mismatches and reverse complements plus clumps in each
+# window, all on the encoded genome.
+#Returns a report dictionary that can be written as JSON.
+def find_ori(genome, window=WINDOW, k=K, d=D, clump_length=None, clump_times=CLUMP_TIMES):
+    codes, tracker = scan_genome(genome)
+    window = min(window, len(codes))
+    candidates = []
+    for start, positions in candidate_windows(tracker.minimum_positions, len(codes), window):
+        codes_in_window = window_codes(codes, start, window)
+        candidate = {
+            "start": int(start),
+            "end": int((start + window) % max(len(codes), 1)),
+            "minimum_skew_positions": positions,
+            "sequence": decode_dna(codes_in_window),
+        }
+        candidate.update(analyze_window(codes_in_window, k, d, clump_length, clump_times))
+        candidates.append(candidate)
+    return {
+        "length": int(len(codes)),
+        "parameters": {"window": window, "k": k, "d": d,
+                       "clump_length": clump_length if clump_length is not None else window,
+                       "clump_times": clump_times},
+        "skew": {
+            "final": tracker.skew,
+            "minimum": tracker.minimum,
+            "minimum_positions": tracker.minimum_positions,
+            "maximum": tracker.maximum,
+            "maximum_positions": tracker.maximum_positions,
+        },
+        "candidates": candidates,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find candidate replication origins (ori) of genomes")
+    parser.add_argument("genomes", nargs="+", help="genome text files")
+    parser.add_argument("--window", type=int, default=WINDOW, help="length of the candidate ori windows")
+    parser.add_argument("-k", type=int, default=K, help="length of the DnaA box k-mers")
+    parser.add_argument("-d", type=int, default=D, help="mismatches allowed in the frequent words")
+    parser.add_argument("--clump-length", type=int, default=None, help="L of the clumps (default: the window)")
+    parser.add_argument("--clump-times", type=int, default=CLUMP_TIMES, help="t of the clumps")
+    parser.add_argument("--output", help="JSON file for the report (default: standard output)")
+    args = parser.parse_args(argv)
+
+    report = {}
+    for path in args.genomes:
+        report[path] = find_ori(path, args.window, args.k, args.d, args.clump_length, args.clump_times)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import multiprocessing
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from .DnaMatrix import DnaMatrix
+
+#DNA strings and cancellation flag of the current worker, set once per process by
+# _init_worker so the DNA is not sent along with every restart
+_dna = None
+_cancelled = None
+
+def _init_worker(dna, cancelled):
+    global _dna, _cancelled
+    _dna = dna
+    _cancelled = cancelled
+
+#Runs one restart: seeds the random module with the restart's own seed so the
+# result only depends on the restart, not on the worker or the order of execution
+def _run_restart(search, score, restart_seed, args):
+    if _cancelled is not None and _cancelled.is_set():
+        return None
+    random.seed(restart_seed)
+    motifs = search(_dna, *args)
+    return score(motifs), motifs
+
+#One seed per restart derived from the base seed
+def restart_seeds(seed, restarts):
+    return [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(restarts)]
+
+#(best score, best motifs) of a run; (inf, []) when no restart ran, as the
+# sequential loops return
+def _result(best):
+    if best is None:
+        return float('inf'), []
+    return best[0], best[2]
+
+#Calls search(dna, *args) restarts times and returns (best score, best motifs).
+#search and score must be module-level functions so they can be sent to workers.
+#Every restart gets its own seed (restart_seeds), so for a given seed the result
+# is the same with any number of workers; among equal scores the lowest restart
+# wins. The DNA is handed to each worker process once, when it starts: strings
+# of equal length are put in a shared memory DnaMatrix for the life of the pool,
+# which the workers attach to instead of holding copies.
+#workers=1 runs in the current process and leaves its random state as it found
+# it. With target_score, pending restarts are
+# cancelled as soon as one reaches a score <= target_score; which restarts had
+# run by then depends on scheduling, so only the score is then guaranteed.
+def run_restarts(search, score, dna, args, restarts, workers=None, seed=0, target_score=None):
+    seeds = restart_seeds(seed, restarts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    best = None
+    if workers == 1:
+        _init_worker(dna, None)
+        state = random.getstate() #The restarts reseed the caller's random module
+        try:
+            for i, restart_seed in enumerate(seeds):
+                curr_score, motifs = _run_restart(search, score, restart_seed, args)
+                if best is None or curr_score < best[0]:
+                    best = (curr_score, i, motifs)
+                if target_score is not None and curr_score <= target_score:
+                    break
+        finally:
+            random.setstate(state)
+        return _result(best)
+
+    shared = None
+    if not isinstance(dna, DnaMatrix) and len(set(map(len, dna))) == 1:
+        shared = dna = DnaMatrix.from_sequences(dna).share()
+    cancelled = multiprocessing.Event()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(dna, cancelled)) as executor:
+            pending = {executor.submit(_run_restart, search, score, restart_seed, args): i
+                       for i, restart_seed in enumerate(seeds)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = pending.pop(future)
+                    result = future.result()
+                    if result is None: #Skipped after cancellation
+                        continue
+                    curr_score, motifs = result
+                    if best is None or (curr_score, i) < best[:2]:
+                        best = (curr_score, i, motifs)
+                    if target_score is not None and curr_score <= target_score:
+                        cancelled.set()
+                        for other in pending:
+                            other.cancel()
+                pending = {future: i for future, i in pending.items() if not future.cancelled()}
+    finally:
+        if shared is not None:
+            shared.close()
+    return _result(best)
@@ -0,0 +1,242 @@
+import random
+
+from .DnaMatrix import DnaMatrix
+from .MotifProfile import (Profile, background_frequencies, count_motifs, most_probable_kmer_position,
+                          most_probable_kmer_positions, score_motifs, score_with_objective)
+from .ParallelRestarts import run_restarts
+from .ScoringMotifs import search_greedy_motif
+
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Output:
+#     {'A': [2, 3, 2, 1, 1, 3], 'C': [3, 2, 5, 3, 1, 1], 'T': [2, 2, 1, 2, 5, 3], 'G': [2, 2, 1, 3, 2, 2]}
+#Adding 1 to each element in the count matrix
+#Count-Matrix : No. of nucleotides in each column
+#Pseudo-Count-Matrix: No. of nucleodies plus 1 in each column.
+#                     Laplace's Rule of Succession: The proabability that sun may never rise tomorrow
+#The counting is one vectorized pass over the encoded motifs (MotifProfile.count_motifs).
+def get_pseudo_count_matrix(motifs):
+    return dict(zip("ACGT", count_motifs(motifs, pseudocount=1).tolist()))
+
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Output:
+#     {'A': [0.2222222222222222, 0.3333333333333333, 0.2222222222222222, 0.1111111111111111, 0.1111111111111111, 0.3333333333333333], 'C': [0.3333333333333333, 0.2222222222222222, 0.5555555555555556, 0.3333333333333333, 0.1111111111111111, 0.1111111111111111], 'T': [0.2222222222222222, 0.2222222222222222, 0.1111111111111111, 0.2222222222222222, 0.5555555555555556, 0.3333333333333333], 'G': [0.2222222222222222, 0.2222222222222222, 0.1111111111111111, 0.3333333333333333, 0.2222222222222222, 0.2222222222222222]}
+#Dividing each element in count matrix by (no. of items in each column + 4)
+#We are adding an extra 1 count to each group in the output (GCAT), not to each element in the motif.  
+#Returns a MotifProfile.Profile, which can be indexed like the dict above.
+def get_pseudo_profile_matrix(motifs):
+    return Profile.from_motifs(motifs, pseudocount=1)
+
+# Takes the count matrix and prints out a string which has the most value in each column
+# If two nucleotides have same count number then a nucleotide is selected randomly. 
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Count Matrix:
+#     {'A': [2, 3, 2, 1, 1, 3],
+#      'C': [3, 2, 5, 3, 1, 1], 
+#      'T': [2, 2, 1, 2, 5, 3], 
+#      'G': [2, 2, 1, 3, 2, 2]}
+# Output:
+#  Consensus String:
+#   CACCTA
+#The consensus is the column argmax of the count matrix (MotifProfile.score_motifs),
+# which takes the first of A, C, G, T on ties like the loop it replaces.
+def get_consensus_string(motifs):
+    score, consensus, counts = score_motifs(motifs)
+    return consensus
+
+# Takes in the consensus string and computes how many nucleotides are off in each column
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Consensus String: CACCTA 
+# Output:
+#     3+3+1+3+1+3  
+#     14
+#Computed from the count matrix as t minus the column maximum, summed over the columns.
+# Callers that already hold the count matrix of the motifs (an array or a dict such as
+# get_count_matrix or get_pseudo_count_matrix return) can pass it and skip the counting.
+def compute_score(motifs, counts=None):
+    score, consensus, counts = score_motifs(motifs, counts)
+    return score
+
+# Input:
+#     ACGGGGATTACC
+#     0.2 0.2 0.0 0.0 0.0 0.0 0.9 0.1 0.1 0.1 0.3 0.0
+#     0.1 0.6 0.0 0.0 0.0 0.0 0.0 0.4 0.1 0.2 0.4 0.6
+#     0.0 0.0 1.0 1.0 0.9 0.9 0.1 0.0 0.0 0.0 0.0 0.0
+#     0.7 0.2 0.0 0.0 0.1 0.1 0.0 0.5 0.8 0.7 0.3 0.4
+# Output:
+#     0.000839808
+# To implement a function Pr(Text, Profile), we begin by 
+# setting a “probability” variable p equal to 1. We then range
+# through the characters of Text one at a time. At position i of Text, 
+# we set p equal to p times the value of Profile corresponding to symbol
+# Text[i] and column i, which is just Profile[Text[i]][i].
+#The probability that a profile matrix will produce a given string is given by the product of individual nucleotide probabilities.
+#Computes probability of the k-mer occuring. 
+# Multiplies the probability of nucleotide in each column
+def compute_probability(text, profile_matrix):
+    probability = 1
+    for i in range(len(text)):
+        probability *= profile_matrix[text[i]][i]
+    return probability
+
+#Computes the most probable kmer based on the profile matrix
+# Compares probability of each kmer
+#All windows are scored at once in log space (MotifProfile.most_probable_kmer_position),
+# the first of equally probable k-mers wins.
+def compute_profile_most_probable_kmer(text, k, profile_matrix):
+    i = most_probable_kmer_position(text, k, profile_matrix)
+    return text[i:i+k]
+
+# NEXT SECTION
+# Input:
+#     0.8 0.0 0.0 0.2
+#     0.0 0.6 0.2 0.0
+#     0.2 0.2 0.8 0.0
+#     0.0 0.2 0.0 0.8
+#     TTACCTTAAC
+#     GATGTCTGTC
+#     ACGGCGTTAG
+#     CCCTAACGAG
+#     CGTCAGAGGT
+# Output:
+#     ACCT
+#     ATGT
+#     GCGT
+#     ACGA
+#     AGGT
+# Returns most probable motifs based on the profile matrix
+#When all DNA strings have the same length they are scored in one batched call.
+# A DnaMatrix is scored straight from its codes.
+def compute_motifs(profile_matrix, dna, k):
+    if isinstance(dna, DnaMatrix):
+        return dna.kmers(most_probable_kmer_positions(dna, k, profile_matrix), k)
+    if len(set(map(len, dna))) != 1:
+        return [compute_profile_most_probable_kmer(text, k, profile_matrix) for text in dna]
+    positions = most_probable_kmer_positions(dna, k, profile_matrix)
+    return [text[i:i+k] for text, i in zip(dna, positions)]
+
+#t = len(dna)
+#k: k-mer
+#dna: list of strings dna
+#RandomMotifs
+#Generates random motifs (k-mers) from each DNA string
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Output:
+#     AA
+#     CG
+#     CT
+#     GA
+#     GG
+# Assuming k = 2
+def generate_random_motifs(dna,k,t):
+    random_kmers = []
+    for i in range(t):
+        r = random.randint(0,len(dna[0])-k)
+        random_kmers.append(dna[i][r:r+k])
+    return random_kmers
+
+#Randomly generate motifs from strings of DNA
+# Assign it as the best motifs
+# In iteration:
+#  Iteration is done until the value of score is minimized. 
+#  Generate a profile matrix based on the motifs computed
+#  motifs is computed from the most probable kmer based on the profile matrix in each DNA String
+#  If the score improves (becomes less) then the iteration continues
+#  Else the best motif computed is returned. 
+#objective selects the score to minimize (MotifProfile.OBJECTIVES); relative_entropy
+# uses background nucleotide frequencies, by default those of dna.
+def compute_randomized_motif_search(dna,k,t,objective="consensus",background=None):
+    if objective == "relative_entropy" and background is None:
+        background = background_frequencies(dna)
+    m = generate_random_motifs(dna,k,t)
+    best_motifs = m
+    best_score = score_with_objective(best_motifs, objective, background)
+
+    while True:
+        profile = get_pseudo_profile_matrix(m)
+        m = compute_motifs(profile,dna,k)
+        score = score_with_objective(m, objective, background)
+        if score < best_score:
+            best_motifs = m
+            best_score = score
+        else:
+            return best_motifs
+
+#GreedyMotifSearch with pseudocounts: the profiles of the chosen motifs are built
+# like get_pseudo_profile_matrix. Runs the same engine as ScoringMotifs.search_greedy_motif.
+def search_greedy_motif_with_pseudocounts(dna,k,t,objective="consensus",background=None):
+    return search_greedy_motif(dna,k,t,objective,background,pseudocount=1)
+
+#Call RandomizedMotifSearch(dna,k,t) N times, storing the best-scoring set of motifs
+#With workers or seed set the restarts run through ParallelRestarts.run_restarts:
+# spread over a process pool, each with its own seed derived from seed, so the
+# result is reproducible whatever the number of workers.
+#With target_score the search stops once a restart scores target_score or less.
+def RepeatedRandomizedMotifSearch(dna, k, t, workers=None, seed=None, N=100, target_score=None):
+    if workers is not None or seed is not None:
+        BestScore, BestMotifs = run_restarts(compute_randomized_motif_search, compute_score, dna, (k, t),
+                                             N, workers=workers, seed=seed or 0, target_score=target_score)
+        return BestMotifs
+    BestScore = float('inf')
+    BestMotifs = []
+    for i in range(N):
+        Motifs = compute_randomized_motif_search(dna, k, t)
+        CurrScore = compute_score(Motifs)
+        if CurrScore < BestScore:
+            BestScore = CurrScore
+            BestMotifs = Motifs
+        if target_score is not None and CurrScore <= target_score:
+            break
+    return BestMotifs
+
+#Hyperlinked DosR dataset
+dna = ["GCGCCCCGCCCGGACAGCCATGCGCTAACCCTGGCTTCGATGGCGCCGGCTCAGTTAGGGCCGGAAGTCCCCAATGTGGCAGACCTTTCGCCCCTGGCGGACGAATGACCCCAGTGGCCGGGACTTCAGGCCCTATCGGAGGGCTCCGGCGCGGTGGTCGGATTTGTCTGTGGAGGTTACACCCCAATCGCAAGGATGCATTATGACCAGCGAGCTGAGCCTGGTCGCCACTGGAAAGGGGAGCAACATC",
+        "CCGATCGGCATCACTATCGGTCCTGCGGCCGCCCATAGCGCTATATCCGGCTGGTGAAATCAATTGACAACCTTCGACTTTGAGGTGGCCTACGGCGAGGACAAGCCAGGCAAGCCAGCTGCCTCAACGCGCGCCAGTACGGGTCCATCGACCCGCGGCCCACGGGTCAAACGACCCTAGTGTTCGCTACGACGTGGTCGTACCTTCGGCAGCAGATCAGCAATAGCACCCCGACTCGAGGAGGATCCCG",
+        "ACCGTCGATGTGCCCGGTCGCGCCGCGTCCACCTCGGTCATCGACCCCACGATGAGGACGCCATCGGCCGCGACCAAGCCCCGTGAAACTCTGACGGCGTGCTGGCCGGGCTGCGGCACCTGATCACCTTAGGGCACTTGGGCCACCACAACGGGCCGCCGGTCTCGACAGTGGCCACCACCACACAGGTGACTTCCGGCGGGACGTAAGTCCCTAACGCGTCGTTCCGCACGCGGTTAGCTTTGCTGCC",
+        "GGGTCAGGTATATTTATCGCACACTTGGGCACATGACACACAAGCGCCAGAATCCCGGACCGAACCGAGCACCGTGGGTGGGCAGCCTCCATACAGCGATGACCTGATCGATCATCGGCCAGGGCGCCGGGCTTCCAACCGTGGCCGTCTCAGTACCCAGCCTCATTGACCCTTCGACGCATCCACTGCGCGTAAGTCGGCTCAACCCTTTCAAACCGCTGGATTACCGACCGCAGAAAGGGGGCAGGAC",
+        "GTAGGTCAAACCGGGTGTACATACCCGCTCAATCGCCCAGCACTTCGGGCAGATCACCGGGTTTCCCCGGTATCACCAATACTGCCACCAAACACAGCAGGCGGGAAGGGGCGAAAGTCCCTTATCCGACAATAAAACTTCGCTTGTTCGACGCCCGGTTCACCCGATATGCACGGCGCCCAGCCATTCGTGACCGACGTCCCCAGCCCCAAGGCCGAACGACCCTAGGAGCCACGAGCAATTCACAGCG",
+        "CCGCTGGCGACGCTGTTCGCCGGCAGCGTGCGTGACGACTTCGAGCTGCCCGACTACACCTGGTGACCACCGCCGACGGGCACCTCTCCGCCAGGTAGGCACGGTTTGTCGCCGGCAATGTGACCTTTGGGCGCGGTCTTGAGGACCTTCGGCCCCACCCACGAGGCCGCCGCCGGCCGATCGTATGACGTGCAATGTACGCCATAGGGTGCGTGTTACGGCGATTACCTGAAGGCGGCGGTGGTCCGGA",
+        "GGCCAACTGCACCGCGCTCTTGATGACATCGGTGGTCACCATGGTGTCCGGCATGATCAACCTCCGCTGTTCGATATCACCCCGATCTTTCTGAACGGCGGTTGGCAGACAACAGGGTCAATGGTCCCCAAGTGGATCACCGACGGGCGCGGACAAATGGCCCGCGCTTCGGGGACTTCTGTCCCTAGCCCTGGCCACGATGGGCTGGTCGGATCAAAGGCATCCGTTTCCATCGATTAGGAGGCATCAA",
+        "GTACATGTCCAGAGCGAGCCTCAGCTTCTGCGCAGCGACGGAAACTGCCACACTCAAAGCCTACTGGGCGCACGTGTGGCAACGAGTCGATCCACACGAAATGCCGCCGTTGGGCCGCGGACTAGCCGAATTTTCCGGGTGGTGACACAGCCCACATTTGGCATGGGACTTTCGGCCCTGTCCGCGTCCGTGTCGGCCAGACAAGCTTTGGGCATTGGCCACAATCGGGCCACAATCGAAAGCCGAGCAG",
+        "GGCAGCTGTCGGCAACTGTAAGCCATTTCTGGGACTTTGCTGTGAAAAGCTGGGCGATGGTTGTGGACCTGGACGAGCCACCCGTGCGATAGGTGAGATTCATTCTCGCCCTGACGGGTTGCGTCTGTCATCGGTCGATAAGGACTAACGGCCCTCAGGTGGGGACCAACGCCCCTGGGAGATAGCGGTCCCCGCCAGTAACGTACCGCTGAACCGACGGGATGTATCCGCCCCAGCGAAGGAGACGGCG",
+        "TCAGCACCATGACCGCCTGGCCACCAATCGCCCGTAACAAGCGGGACGTCCGCGACGACGCGTGCGCTAGCGCCGTGGCGGTGACAACGACCAGATATGGTCCGAGCACGCGGGCGAACCTCGTGTTCTGGCCTCGGCCAGTTGTGTAGAGCTCATCGCTGTCATCGAGCGATATCCGACCACTGATCCAAGTCGGGGGCTCTGGGGACCGAAGTCCCCGGGCTCGGAGCTATCGGACCTCACGATCACC"]
+
+#setting up variables:
+#t : Number of strings in dna
+#k : k-mer
+#N : Number of times we want to do gibbs sampling
+t = 10
+k = 15
+N = 100
+
+if __name__ == "__main__":
+    BestMotifs = RepeatedRandomizedMotifSearch(dna, k, t)
+    # Print the BestMotifs variable
+    print(BestMotifs)
+    print(compute_score(BestMotifs))
+
+
@@ -0,0 +1,54 @@
+import numpy as np
+
+from .KmerCounting import encode_dna, reverse_complement_codes
+
+#Input: A string Pattern
+#Output: The reverse of Pattern
+def Reverse(Pattern):
+    rev = ""
+    for char in Pattern:
+        rev = char + rev
+    return rev
+
+def ReversePython(Pattern):
+    return Pattern[::-1]
+
+# Input:  A DNA string Pattern
+compdict = {'A':'T', 'T':'A', 'C':'G', 'G':'C'}
+# Output: The complementary string of Pattern (with every nucleotide replaced by its complement).
+def Complement(Pattern):
+    # your code here
+    compstring = ''
+    for char in Pattern:
+        compstring = compstring + compdict[char]
+    return compstring
+
+def ComplementAlternate(Pattern):
+    return ''.join([compdict[n] for n in Pattern])
+
+#Translation tables for the bulk path, lower case is complemented as well
+_COMPLEMENT_STR = str.maketrans("ACGTacgt", "TGCAtgca")
+_COMPLEMENT_BYTES = bytes.maketrans(b"ACGTacgt", b"TGCAtgca")
+
+#Reverse Complement function because we read 5' to 3'
+#Complementing with translate and reversing with a slice are both single
+# passes in C, so this is linear even for a whole genome.
+def ReverseComplement(Pattern):
+    if isinstance(Pattern, (bytes, bytearray)):
+        return Pattern.translate(_COMPLEMENT_BYTES)[::-1]
+    return Pattern.translate(_COMPLEMENT_STR)[::-1]
+
+#Reverse complement of a sequence of 2-bit codes (see KmerCounting.py).
+#The complement of code x is 3 - x, so this is one subtraction over a reversed
+# view. out may be a preallocated array of the same length to write into.
+# A PackedGenome is reverse-complemented through its codes.
+def ReverseComplementCodes(codes, out=None):
+    codes = encode_dna(codes)
+    return np.subtract(3, codes[::-1], out=out, dtype=np.uint8)
+
+#Reverse complements of many k-mers given as integer codes, returned as codes
+def ReverseComplementKmers(codes, k):
+    return reverse_complement_codes(codes, k)
+
+if __name__ == "__main__":
+    print(ReverseComplement("GATTACA"))
\ No newline at end of file
@@ -0,0 +1,204 @@
+import random
+
+import numpy as np
+
+from .KmerCounting import decode_dna, encode_dna
+from .MotifProfile import (Profile, background_frequencies, column_scores, count_motifs, encode_motifs, first_max,
+                          most_probable_kmer_position, score_motifs, score_with_objective)
+
+#Upper bound on the start positions x windows x k log-profile gathers held at
+# once by search_greedy_motif
+GREEDY_BLOCK = 1 << 22
+
+#Pre-condition: A list of strings as sent as an input
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Output:
+#     {'A': [1, 2, 1, 0, 0, 2], 
+#      'C': [2, 1, 4, 2, 0, 0], 
+#      'G': [1, 1, 0, 2, 1, 1], 
+#      'T': [1, 1, 0, 1, 4, 2]}
+# Computes number of nucleotides in each column
+#The counting is one vectorized pass over the encoded motifs (MotifProfile.count_motifs).
+def get_count_matrix(motifs):
+    return dict(zip("ACGT", count_motifs(motifs).tolist()))
+
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Output:
+#     {'A': [0.2, 0.4, 0.2, 0.0, 0.0, 0.4], 
+#      'C': [0.4, 0.2, 0.8, 0.4, 0.0, 0.0], 
+#      'G': [0.2, 0.2, 0.0, 0.4, 0.2, 0.2], 
+#      'T': [0.2, 0.2, 0.0, 0.2, 0.8, 0.4]}
+# Computed by divided the number of nucleotides in each column by the total no. of rows. 
+# Sum of each column should be 1
+#Returns a MotifProfile.Profile, which can be indexed like the dict above.
+def get_profile_matrix(motifs):
+    return Profile.from_motifs(motifs)
+
+
+# Takes the count matrix and prints out a string which has the most value in each column
+# If two nucleotides have same count number then a nucleotide is selected randomly. 
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Count Matrix:
+#     {'A': [2, 3, 2, 1, 1, 3],
+#      'C': [3, 2, 5, 3, 1, 1], 
+#      'T': [2, 2, 1, 2, 5, 3], 
+#      'G': [2, 2, 1, 3, 2, 2]}
+# Output:
+#  Consensus String:
+#   CACCTA
+#The consensus is the column argmax of the count matrix (MotifProfile.score_motifs),
+# which takes the first of A, C, G, T on ties like the loop it replaces.
+def get_consensus_string(motifs):
+    score, consensus, counts = score_motifs(motifs)
+    return consensus
+
+# Takes in the consensus string and computes how many nucleotides are off in each column
+# Input:
+#     AACGTA
+#     CCCGTT
+#     CACCTT
+#     GGATTA
+#     TTCCGG
+# Consensus String: CACCTA 
+# Output:
+#     3+3+1+3+1+3  
+#     14
+#Computed from the count matrix as t minus the column maximum, summed over the columns.
+# Callers that already hold the count matrix of the motifs (an array or a dict such as
+# get_count_matrix or get_pseudo_count_matrix return) can pass it and skip the counting.
+def compute_score(motifs, counts=None):
+    score, consensus, counts = score_motifs(motifs, counts)
+    return score
+
+# Input:
+#     ACGGGGATTACC
+#     0.2 0.2 0.0 0.0 0.0 0.0 0.9 0.1 0.1 0.1 0.3 0.0
+#     0.1 0.6 0.0 0.0 0.0 0.0 0.0 0.4 0.1 0.2 0.4 0.6
+#     0.0 0.0 1.0 1.0 0.9 0.9 0.1 0.0 0.0 0.0 0.0 0.0
+#     0.7 0.2 0.0 0.0 0.1 0.1 0.0 0.5 0.8 0.7 0.3 0.4
+# Output:
+#     0.000839808
+# To implement a function Pr(Text, Profile), we begin by 
+# setting a “probability” variable p equal to 1. We then range
+# through the characters of Text one at a time. At position i of Text, 
+# we set p equal to p times the value of Profile corresponding to symbol
+# Text[i] and column i, which is just Profile[Text[i]][i].
+#The probability that a profile matrix will produce a given string is given by the product of individual nucleotide probabilities.
+#Computes probability of the k-mer occuring. 
+# Multiplies the probability of nucleotide in each column
+def compute_probability(text, profile_matrix):
+    probability = 1
+    for i in range(len(text)):
+        probability *= profile_matrix[text[i]][i]
+    return probability
+
+#Computes the most probable kmer based on the profile matrix
+# Compares probability of each kmer
+#All windows are scored at once in log space (MotifProfile.most_probable_kmer_position),
+# the first of equally probable k-mers wins.
+def compute_profile_most_probable_kmer(text, k, profile_matrix):
+    i = most_probable_kmer_position(text, k, profile_matrix)
+    return text[i:i+k]
+
+# Test 0 # Sample Dataset 
+# Input:
+#     3 5
+#     GGCGTTCAGGCA
+#     AAGAATCAGTCA
+#     CAAGGAGTTCGC
+#     CACGTCAATCAC
+#     CAATAATATTCG
+# Output:
+#     CAG
+#     CAG
+#     CAA
+#     CAA
+#     CAA
+# t = number of k-mers in dna
+#http://www.mrgraeme.co.uk/greedy-motif-search/
+#Steps:
+# First k-mer is extracted from each string and is assigned as the best motif
+# In each iteration of seletecting every kmer from the string
+# New profile matrix is build after making motifs from each string(row) of DNA
+# Next motif is added based on the newly created profile matrix
+# Motif with the least score is iniialized as the best motif. 
+#objective selects the score to minimize (MotifProfile.OBJECTIVES); relative_entropy
+# uses background nucleotide frequencies, by default those of dna.
+#All start positions in dna[0] are run together. Each keeps the count matrix of
+# the motifs chosen so far and extends it by one row per DNA string, so the
+# profile of motifs[0:j] is never recounted; its log is taken once per step for
+# all starts and every window of dna[j] is scored against it in one gather.
+#With pseudocount the profile of j motifs is (count + pseudocount) / (j + 4*pseudocount),
+# the profile of PseudoScoringMotifs.get_pseudo_profile_matrix for pseudocount=1.
+#Ties between windows and between starts go to the first, as in the loop over
+# get_profile_matrix and compute_profile_most_probable_kmer this replaces.
+def search_greedy_motif(dna,k,t,objective="consensus",background=None,pseudocount=0):
+    if objective == "relative_entropy" and background is None:
+        background = background_frequencies(dna)
+    best_motifs = []
+    for i in range(1,t):
+        best_motifs.append(dna[i][0:k])
+    best_score = score_with_objective(best_motifs, objective, background)
+
+    if len(set(len(dna[j]) for j in range(t))) == 1:
+        rows = list(encode_motifs(dna)[:t])
+    else:
+        rows = [encode_dna(dna[j]) for j in range(t)]
+    columns = np.arange(k)
+    windows = [np.lib.stride_tricks.sliding_window_view(row, k) for row in rows]
+    starts = len(windows[0])
+    if starts <= 0:
+        return best_motifs
+
+    positions = np.zeros((starts, t), dtype=np.intp)
+    positions[:, 0] = np.arange(starts)
+    counts = np.zeros((starts, 4, k), dtype=np.int64)
+    counts[np.arange(starts)[:, None], windows[0], columns] = 1
+    for j in range(1,t):
+        with np.errstate(divide="ignore"):
+            log_profiles = np.log((counts + pseudocount) / (j + 4*pseudocount))
+        block = max(1, GREEDY_BLOCK // (len(windows[j]) * k))
+        for s in range(0, starts, block):
+            scores = log_profiles[s:s+block][:, windows[j], columns].sum(axis=-1)
+            positions[s:s+block, j] = first_max(scores)
+        counts[np.arange(starts)[:, None], windows[j][positions[:, j]], columns] += 1
+
+    scores = column_scores(counts, objective, background).sum(axis=-1)
+    best = int(np.argmin(scores))
+    if scores[best] < best_score:
+        best_motifs = [decode_dna(windows[j][positions[best, j]]) for j in range(t)]
+    return best_motifs
+
+#Hyperlinked DosR dataset
+dna = ["GCGCCCCGCCCGGACAGCCATGCGCTAACCCTGGCTTCGATGGCGCCGGCTCAGTTAGGGCCGGAAGTCCCCAATGTGGCAGACCTTTCGCCCCTGGCGGACGAATGACCCCAGTGGCCGGGACTTCAGGCCCTATCGGAGGGCTCCGGCGCGGTGGTCGGATTTGTCTGTGGAGGTTACACCCCAATCGCAAGGATGCATTATGACCAGCGAGCTGAGCCTGGTCGCCACTGGAAAGGGGAGCAACATC",
+        "CCGATCGGCATCACTATCGGTCCTGCGGCCGCCCATAGCGCTATATCCGGCTGGTGAAATCAATTGACAACCTTCGACTTTGAGGTGGCCTACGGCGAGGACAAGCCAGGCAAGCCAGCTGCCTCAACGCGCGCCAGTACGGGTCCATCGACCCGCGGCCCACGGGTCAAACGACCCTAGTGTTCGCTACGACGTGGTCGTACCTTCGGCAGCAGATCAGCAATAGCACCCCGACTCGAGGAGGATCCCG",
+        "ACCGTCGATGTGCCCGGTCGCGCCGCGTCCACCTCGGTCATCGACCCCACGATGAGGACGCCATCGGCCGCGACCAAGCCCCGTGAAACTCTGACGGCGTGCTGGCCGGGCTGCGGCACCTGATCACCTTAGGGCACTTGGGCCACCACAACGGGCCGCCGGTCTCGACAGTGGCCACCACCACACAGGTGACTTCCGGCGGGACGTAAGTCCCTAACGCGTCGTTCCGCACGCGGTTAGCTTTGCTGCC",
+        "GGGTCAGGTATATTTATCGCACACTTGGGCACATGACACACAAGCGCCAGAATCCCGGACCGAACCGAGCACCGTGGGTGGGCAGCCTCCATACAGCGATGACCTGATCGATCATCGGCCAGGGCGCCGGGCTTCCAACCGTGGCCGTCTCAGTACCCAGCCTCATTGACCCTTCGACGCATCCACTGCGCGTAAGTCGGCTCAACCCTTTCAAACCGCTGGATTACCGACCGCAGAAAGGGGGCAGGAC",
+        "GTAGGTCAAACCGGGTGTACATACCCGCTCAATCGCCCAGCACTTCGGGCAGATCACCGGGTTTCCCCGGTATCACCAATACTGCCACCAAACACAGCAGGCGGGAAGGGGCGAAAGTCCCTTATCCGACAATAAAACTTCGCTTGTTCGACGCCCGGTTCACCCGATATGCACGGCGCCCAGCCATTCGTGACCGACGTCCCCAGCCCCAAGGCCGAACGACCCTAGGAGCCACGAGCAATTCACAGCG",
+        "CCGCTGGCGACGCTGTTCGCCGGCAGCGTGCGTGACGACTTCGAGCTGCCCGACTACACCTGGTGACCACCGCCGACGGGCACCTCTCCGCCAGGTAGGCACGGTTTGTCGCCGGCAATGTGACCTTTGGGCGCGGTCTTGAGGACCTTCGGCCCCACCCACGAGGCCGCCGCCGGCCGATCGTATGACGTGCAATGTACGCCATAGGGTGCGTGTTACGGCGATTACCTGAAGGCGGCGGTGGTCCGGA",
+        "GGCCAACTGCACCGCGCTCTTGATGACATCGGTGGTCACCATGGTGTCCGGCATGATCAACCTCCGCTGTTCGATATCACCCCGATCTTTCTGAACGGCGGTTGGCAGACAACAGGGTCAATGGTCCCCAAGTGGATCACCGACGGGCGCGGACAAATGGCCCGCGCTTCGGGGACTTCTGTCCCTAGCCCTGGCCACGATGGGCTGGTCGGATCAAAGGCATCCGTTTCCATCGATTAGGAGGCATCAA",
+        "GTACATGTCCAGAGCGAGCCTCAGCTTCTGCGCAGCGACGGAAACTGCCACACTCAAAGCCTACTGGGCGCACGTGTGGCAACGAGTCGATCCACACGAAATGCCGCCGTTGGGCCGCGGACTAGCCGAATTTTCCGGGTGGTGACACAGCCCACATTTGGCATGGGACTTTCGGCCCTGTCCGCGTCCGTGTCGGCCAGACAAGCTTTGGGCATTGGCCACAATCGGGCCACAATCGAAAGCCGAGCAG",
+        "GGCAGCTGTCGGCAACTGTAAGCCATTTCTGGGACTTTGCTGTGAAAAGCTGGGCGATGGTTGTGGACCTGGACGAGCCACCCGTGCGATAGGTGAGATTCATTCTCGCCCTGACGGGTTGCGTCTGTCATCGGTCGATAAGGACTAACGGCCCTCAGGTGGGGACCAACGCCCCTGGGAGATAGCGGTCCCCGCCAGTAACGTACCGCTGAACCGACGGGATGTATCCGCCCCAGCGAAGGAGACGGCG",
+        "TCAGCACCATGACCGCCTGGCCACCAATCGCCCGTAACAAGCGGGACGTCCGCGACGACGCGTGCGCTAGCGCCGTGGCGGTGACAACGACCAGATATGGTCCGAGCACGCGGGCGAACCTCGTGTTCTGGCCTCGGCCAGTTGTGTAGAGCTCATCGCTGTCATCGAGCGATATCCGACCACTGATCCAAGTCGGGGGCTCTGGGGACCGAAGTCCCCGGGCTCGGAGCTATCGGACCTCACGATCACC"]
+
+t = len(dna)
+k = 15
+if __name__ == "__main__":
+    motifs = search_greedy_motif(dna,k,t)
+    print(motifs)
+    print(compute_score(motifs))
\ No newline at end of file
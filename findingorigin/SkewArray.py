@@ -0,0 +1,137 @@
+import numpy as np
+
+from .ApproximateMatching import ApproximateMatcher, scan_approximate
+from .KmerCounting import encode_dna
+
+#Skew step of each 2-bit code: A and T leave the skew unchanged, C decreases it, G increases it
+SKEW_STEPS = np.array([0, -1, 1, 0], dtype=np.int8)
+
+#Size of the pieces read by read_genome_chunks
+CHUNK_SIZE = 1 << 22
+
+#Input: A String Genome
+#Output: THe skew array of Genome as a NumPy int32 array of length len(genome)+1.
+#The genome is mapped through SKEW_STEPS into an int8 array and summed with a single cumsum.
+def compute_skew_array(genome):
+    steps = SKEW_STEPS[encode_dna(genome)]
+    skew_array = np.zeros(len(steps) + 1, dtype=np.int32)
+    np.cumsum(steps, dtype=np.int32, out=skew_array[1:])
+    return skew_array
+
+#Returns (skew array, positions of the minimum skew, positions of the maximum skew)
+def compute_skew(genome):
+    skew_array = compute_skew_array(genome)
+    minimum = np.flatnonzero(skew_array == skew_array.min()).tolist()
+    maximum = np.flatnonzero(skew_array == skew_array.max()).tolist()
+    return skew_array, minimum, maximum
+
+#Determines the minimum position in the genome
+#The point where the number of occurences of 'C' is the least. 
+#These may be the possible location of OriC. 
+def compute_minimum_skew(genome):
+    skew_array, minimum, maximum = compute_skew(genome)
+    return minimum
+
+#Skew of a genome that arrives in pieces. Only the running skew and the
+# extremes are kept between chunks, so the genome never has to be in memory
+# as a whole. update() returns the skew values of the chunk for callers that
+# want to store or plot them.
+class SkewTracker:
+
+    def __init__(self):
+        self.length = 0 #Bases seen so far
+        self.skew = 0 #Skew after the last base
+        self.minimum = 0
+        self.minimum_positions = [0]
+        self.maximum = 0
+        self.maximum_positions = [0]
+
+    def update(self, chunk):
+        steps = SKEW_STEPS[encode_dna(chunk)]
+        values = np.cumsum(steps, dtype=np.int32)
+        values += self.skew
+        if len(values) > 0:
+            self._track(values, values.min(), "minimum")
+            self._track(values, values.max(), "maximum")
+            self.skew = int(values[-1])
+        self.length += len(values)
+        return values
+
+    #Keeps the positions of the smallest (or largest) skew seen so far
+    def _track(self, values, extreme, name):
+        extreme = int(extreme)
+        current = getattr(self, name)
+        positions = (self.length + 1 + np.flatnonzero(values == extreme)).tolist()
+        improves = extreme < current if name == "minimum" else extreme > current
+        if improves:
+            setattr(self, name, extreme)
+            setattr(self, name + "_positions", positions)
+        elif extreme == current:
+            getattr(self, name + "_positions").extend(positions)
+
+#Reads a genome file in pieces of chunk_size bytes, dropping line breaks and
+# FASTA header lines ('>' at the start of a line). The records of a
+# multi-record FASTA file are read as one genome, in file order.
+def read_genome_chunks(path, chunk_size=CHUNK_SIZE):
+    header = False #Inside a header line that started in an earlier chunk
+    line_start = True #The next byte starts a line
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            if not header and b">" not in chunk:
+                line_start = chunk.endswith(b"\n")
+                yield chunk.replace(b"\n", b"").replace(b"\r", b"")
+                continue
+            kept = []
+            for i, line in enumerate(chunk.split(b"\n")):
+                if i > 0: #A line break ended the previous line
+                    header, line_start = False, True
+                if line_start and line.startswith(b">"):
+                    header = True
+                if not header:
+                    kept.append(line)
+                if line:
+                    line_start = False
+            yield b"".join(kept).replace(b"\r", b"")
+
+#Streaming counterpart of compute_skew: returns the SkewTracker after all chunks
+def compute_skew_streaming(chunks):
+    tracker = SkewTracker()
+    for chunk in chunks:
+        tracker.update(chunk)
+    return tracker
+
+#We say that position i in k-mers p and q is a mismatch if the symbols at position i
+# of the two strings are not the same. The total number of mismatches between strings p and q
+# is called the Hamming distance between these strings. 
+def compute_hamming_distance(p,q):
+    num_of_mismatches = 0
+    for i in range(len(p)):
+        if p[i] != q[i]:
+            num_of_mismatches += 1
+    return num_of_mismatches
+
+#We say that a k-mer Pattern appears as a substring of Text with at most d mismatches 
+# f there is some k-mer substring Pattern' of Text having d or fewer mismatches with Pattern; 
+# that is, HammingDistance(Pattern, Pattern') ≤ d. Our observation that a DnaA box may appear 
+# with slight variations leads to the following generalization of the Pattern Matching Problem.
+#A single query scans every window of Text at once. Text may also be an
+# ApproximateMatcher built once for the text (optionally on a GenomeIndex), which
+# reuses its encoded text and seed tables across calls (see ApproximateMatching.py).
+def compute_approximate_pattern_matching(Text, Pattern, d):
+    if isinstance(Text, ApproximateMatcher):
+        return Text.find(Pattern, d)
+    return scan_approximate(Text, Pattern, d)
+
+#This function computes the number of occurrences of Pattern in Text with at most d mismatches.
+def compute_approximate_pattern_count(Text, Pattern, d):
+    if isinstance(Text, ApproximateMatcher):
+        return Text.count(Pattern, d)
+    return len(scan_approximate(Text, Pattern, d))
+
+
+if __name__ == "__main__":
+    text = 'AGCGTGCCGAAATATGCCGCCAGACCTGCTGCGGTGGCCTCGCCGACTTCACGGATGCCAAGTGCATAGAGGAAGCGAGCAAAGGTGGTTTCTTTCGCTTTATCCAGCGCGTTAACCACGTTCTGTGCCGACTTT'
+    print(compute_hamming_distance('CAGAAAGGAAGGTCCCCATACACCGACGCACCAGTTTA', 'CACGCCGTATGCATAAACGAGCCGCACGAACCAGAGAG'))
@@ -0,0 +1,127 @@
+#The analysis modules, as submodules of one package (findingorigin.SkewArray, ...).
+#Importing the package loads nothing: every name below is imported from its
+# module the first time it is used, so numpy and the analysis modules are only
+# loaded by the code that needs them (worker processes start in milliseconds).
+#    from findingorigin import FrequencyMap, compute_skew_array, gibbs_sampler
+#The modules only run their demos when executed, see python -m findingorigin --help.
+#In a checkout, the top-level files of the same names (SkewArray.py, ...) keep
+# import SkewArray working; they are not installed.
+import importlib
+import os
+
+#Bundled genomes
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+#Analysis modules, listed by python -m findingorigin modules.
+#Names are looked up in _EXPORTS, not in these modules.
+MODULES = [
+    "KmerCounting",
+    "GenomeLoader",
+    "GenomeIndex",
+    "ApproximateMatching",
+    "SkewArray",
+    "ForwardReverseStrand",
+    "FrequentWords",
+    "ReverseCompliment",
+    "MotifProfile",
+    "DnaMatrix",
+    "ScoringMotifs",
+    "PseudoScoringMotifs",
+    "GibbsSampling",
+    "ParallelRestarts",
+    "MultiChainGibbs",
+    "MedianString",
+    "OriFinder",
+    "BatchDriver",
+]
+
+#Public name -> module defining it
+_EXPORTS = {
+    #k-mer encoding and counting
+    "encode_dna": "KmerCounting",
+    "decode_dna": "KmerCounting",
+    "encode_kmer": "KmerCounting",
+    "decode_kmer": "KmerCounting",
+    "decode_kmers": "KmerCounting",
+    "compute_kmer_codes": "KmerCounting",
+    "count_kmers": "KmerCounting",
+    "count_canonical_kmers": "KmerCounting",
+    "count_kmers_with_mismatches": "KmerCounting",
+    "find_pattern_codes": "KmerCounting",
+    "reverse_complement_codes": "KmerCounting",
+    #Genome files
+    "validate_genome": "GenomeLoader",
+    "PackedGenome": "GenomeLoader",
+    "load_genome": "GenomeLoader",
+    "GenomeIndex": "GenomeIndex",
+    "ApproximateMatcher": "ApproximateMatching",
+    #Skew and symbol arrays
+    "compute_skew_array": "SkewArray",
+    "compute_skew": "SkewArray",
+    "compute_minimum_skew": "SkewArray",
+    "SkewTracker": "SkewArray",
+    "read_genome_chunks": "SkewArray",
+    "compute_skew_streaming": "SkewArray",
+    "compute_hamming_distance": "SkewArray",
+    "compute_approximate_pattern_matching": "SkewArray",
+    "compute_approximate_pattern_count": "SkewArray",
+    "SymbolArray": "ForwardReverseStrand",
+    "FasterSymbolArray": "ForwardReverseStrand",
+    "compute_symbol_arrays": "ForwardReverseStrand",
+    #Frequent words
+    "FrequencyMap": "FrequentWords",
+    "StrandFrequencyMap": "FrequentWords",
+    "FrequentWords": "FrequentWords",
+    "FrequentWordsWithMismatches": "FrequentWords",
+    "FrequentWordsWithMismatchesAndReverseComplements": "FrequentWords",
+    "FindClumps": "FrequentWords",
+    "PatternMatchingIndex": "FrequentWords",
+    "PatternCount": "FrequentWords",
+    "ReverseComplement": "ReverseCompliment",
+    "ReverseComplementCodes": "ReverseCompliment",
+    "ReverseComplementKmers": "ReverseCompliment",
+    #Motifs
+    "Profile": "MotifProfile",
+    "count_motifs": "MotifProfile",
+    "score_motifs": "MotifProfile",
+    "score_with_objective": "MotifProfile",
+    "background_frequencies": "MotifProfile",
+    "DnaMatrix": "DnaMatrix",
+    "get_count_matrix": "ScoringMotifs",
+    "get_profile_matrix": "ScoringMotifs",
+    "get_consensus_string": "ScoringMotifs",
+    "compute_score": "ScoringMotifs",
+    "compute_probability": "ScoringMotifs",
+    "compute_profile_most_probable_kmer": "ScoringMotifs",
+    "search_greedy_motif": "ScoringMotifs",
+    "get_pseudo_count_matrix": "PseudoScoringMotifs",
+    "get_pseudo_profile_matrix": "PseudoScoringMotifs",
+    "compute_motifs": "PseudoScoringMotifs",
+    "generate_random_motifs": "PseudoScoringMotifs",
+    "compute_randomized_motif_search": "PseudoScoringMotifs",
+    "search_greedy_motif_with_pseudocounts": "PseudoScoringMotifs",
+    "RepeatedRandomizedMotifSearch": "PseudoScoringMotifs",
+    "profile_generated_string": "GibbsSampling",
+    "GibbsState": "GibbsSampling",
+    "gibbs_sampler": "GibbsSampling",
+    "repeated_gibbs_sampler": "GibbsSampling",
+    "run_restarts": "ParallelRestarts",
+    "run_gibbs_chains": "MultiChainGibbs",
+    "median_string": "MedianString",
+    "median_string_motifs": "MedianString",
+    #Pipelines
+    "find_ori": "OriFinder",
+    "run_batch": "BatchDriver",
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module("." + _EXPORTS[name], __name__), name)
+    globals()[name] = value #Later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
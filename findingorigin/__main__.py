@@ -0,0 +1,50 @@
+import argparse
+import importlib
+import runpy
+import sys
+
+from findingorigin import MODULES
+
+#Modules with a demo at the bottom, run by: python -m findingorigin demo <module>
+DEMOS = [
+    "SkewArray",
+    "ForwardReverseStrand",
+    "FrequentWords",
+    "ReverseCompliment",
+    "ScoringMotifs",
+    "PseudoScoringMotifs",
+    "GibbsSampling",
+]
+
+#Command line tools, run by: python -m findingorigin <tool> [arguments of the tool]
+TOOLS = {
+    "ori": "OriFinder",
+    "batch": "BatchDriver",
+    "benchmark": "Benchmark",
+}
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = argparse.ArgumentParser(prog="python -m findingorigin",
+                                     description="Run the demos and tools of the analysis modules")
+    parser.add_argument("command", choices=["demo", "modules"] + list(TOOLS))
+    parser.add_argument("arguments", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    if args.command == "modules":
+        print("\n".join(MODULES))
+        return 0
+    if args.command == "demo":
+        demos = args.arguments or DEMOS
+        for name in demos:
+            if name not in DEMOS:
+                parser.error("no demo for %r, expected one of %s" % (name, ", ".join(DEMOS)))
+        for name in demos:
+            print("== %s" % name)
+            runpy.run_module("findingorigin." + name, run_name="__main__")
+        return 0
+    return importlib.import_module("findingorigin." + TOOLS[args.command]).main(args.arguments)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#Checks the vectorized analyses against the loops of the original scripts on
+# random inputs. The reference loops below are copied from the original code.
+import itertools
+import random
+
+import pytest
+
+from findingorigin.ApproximateMatching import ApproximateMatcher
+from findingorigin.FrequentWords import FindClumps, FrequencyMap, FrequentWords, FrequentWordsWithMismatches
+from findingorigin.KmerCounting import count_kmers, decode_kmers
+from findingorigin.MotifProfile import count_motifs
+from findingorigin.PseudoScoringMotifs import get_pseudo_count_matrix
+from findingorigin.ScoringMotifs import compute_profile_most_probable_kmer, compute_score, get_count_matrix, search_greedy_motif
+from findingorigin.SkewArray import compute_approximate_pattern_matching
+
+def random_dna(rng, n):
+    return "".join(rng.choice("ACGT") for _ in range(n))
+
+#--------------Reference loops------------
+def reference_frequency_map(Text, k):
+    freq = {}
+    n = len(Text)
+    for i in range(n-k+1):
+        Pattern = Text[i:i+k]
+        freq[Pattern] = 0
+    for i in range(n-k+1):
+        Pattern = Text[i:i+k]
+        freq[Pattern] = freq[Pattern] + 1
+    return freq
+
+def reference_frequent_words(Text, k):
+    freq = reference_frequency_map(Text, k)
+    m = max(freq.values())
+    return [key for key in freq if freq[key] == m]
+
+def hamming(p, q):
+    return sum(a != b for a, b in zip(p, q))
+
+def reference_frequent_words_with_mismatches(Text, k, d):
+    counts = {}
+    for pattern in map("".join, itertools.product("ACGT", repeat=k)):
+        counts[pattern] = sum(hamming(pattern, Text[i:i+k]) <= d for i in range(len(Text)-k+1))
+    m = max(counts.values())
+    return sorted(pattern for pattern in counts if counts[pattern] == m)
+
+def reference_approximate_matching(Text, Pattern, d):
+    return [i for i in range(len(Text)-len(Pattern)+1) if hamming(Text[i:i+len(Pattern)], Pattern) <= d]
+
+def reference_clumps(Text, k, L, t):
+    clumps = set()
+    for start in range(len(Text)-L+1):
+        freq = reference_frequency_map(Text[start:start+L], k)
+        clumps.update(pattern for pattern in freq if freq[pattern] >= t)
+    return sorted(clumps)
+
+def reference_count_matrix(motifs):
+    count = {symbol: [0] * len(motifs[0]) for symbol in "ACGT"}
+    for motif in motifs:
+        for j, symbol in enumerate(motif):
+            count[symbol][j] += 1
+    return count
+
+def reference_profile_matrix(motifs):
+    count = reference_count_matrix(motifs)
+    return {symbol: [c / len(motifs) for c in count[symbol]] for symbol in "ACGT"}
+
+def reference_score(motifs):
+    count = reference_count_matrix(motifs)
+    consensus = ""
+    for j in range(len(motifs[0])):
+        m = 0
+        frequent_symbol = ""
+        for symbol in "ACGT":
+            if count[symbol][j] > m:
+                m = count[symbol][j]
+                frequent_symbol = symbol
+        consensus += frequent_symbol
+    return sum(motif[j] != consensus[j] for motif in motifs for j in range(len(consensus)))
+
+def reference_probability(text, profile_matrix):
+    probability = 1
+    for i in range(len(text)):
+        probability *= profile_matrix[text[i]][i]
+    return probability
+
+def reference_most_probable_kmer(text, k, profile_matrix):
+    max_probability = -1
+    result = ""
+    for i in range(len(text)-k+1):
+        k_mer = text[i:i+k]
+        temp_probability = reference_probability(k_mer, profile_matrix)
+        if temp_probability > max_probability:
+            result = k_mer
+            max_probability = temp_probability
+    return result
+
+def reference_greedy_motif(dna, k, t):
+    best_motifs = []
+    for i in range(1, t): #Starts without row 0, as the original does
+        best_motifs.append(dna[i][0:k])
+    n = len(dna[0])
+    for i in range(n-k+1):
+        motifs = [dna[0][i:i+k]]
+        for j in range(1, t):
+            p = reference_profile_matrix(motifs[0:j])
+            motifs.append(reference_most_probable_kmer(dna[j], k, p))
+        if reference_score(motifs) < reference_score(best_motifs):
+            best_motifs = motifs
+    return best_motifs
+
+#--------------Tests------------
+@pytest.mark.parametrize("seed", range(20))
+def test_frequency_map(seed):
+    rng = random.Random(seed)
+    text = random_dna(rng, rng.randint(0, 300))
+    k = rng.randint(1, 8)
+    assert list(FrequencyMap(text, k).items()) == list(reference_frequency_map(text, k).items())
+    if len(text) >= k:
+        assert FrequentWords(text, k) == reference_frequent_words(text, k)
+
+@pytest.mark.parametrize("text", ["ACGTNACG", "acgTacgt", "ACGT-ACGT", "NNNNNN"])
+def test_frequency_map_plain_text(text):
+    assert FrequencyMap(text, 3) == reference_frequency_map(text, 3)
+    assert FrequentWords(text, 3) == reference_frequent_words(text, 3)
+
+@pytest.mark.parametrize("seed", range(10))
+def test_count_kmers(seed):
+    rng = random.Random(seed)
+    text = random_dna(rng, rng.randint(1, 2000))
+    k = rng.randint(1, 14)
+    distinct, counts, first = count_kmers(text, k)
+    freq = reference_frequency_map(text, k)
+    assert dict(zip(decode_kmers(distinct, k), counts.tolist())) == freq
+    assert [text.find(word) for word in decode_kmers(distinct, k)] == first.tolist()
+
+@pytest.mark.parametrize("seed", range(5))
+def test_frequent_words_with_mismatches(seed):
+    rng = random.Random(seed)
+    text = random_dna(rng, 60)
+    k, d = rng.randint(3, 5), rng.randint(0, 2)
+    assert sorted(FrequentWordsWithMismatches(text, k, d)) == reference_frequent_words_with_mismatches(text, k, d)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_approximate_pattern_matching(seed):
+    rng = random.Random(seed)
+    text = random_dna(rng, rng.randint(0, 400))
+    pattern = random_dna(rng, rng.randint(0, 20))
+    d = rng.randint(0, 3)
+    expected = reference_approximate_matching(text, pattern, d)
+    assert compute_approximate_pattern_matching(text, pattern, d) == expected
+    assert compute_approximate_pattern_matching(ApproximateMatcher(text), pattern, d) == expected
+
+@pytest.mark.parametrize("seed", range(10))
+def test_find_clumps(seed):
+    rng = random.Random(seed)
+    text = random_dna(rng, rng.randint(20, 200))
+    k, L, t = rng.randint(2, 4), rng.randint(10, 40), rng.randint(2, 4)
+    assert sorted(FindClumps(text, k, L, t)) == reference_clumps(text, k, L, t)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_profile_most_probable_kmer(seed):
+    rng = random.Random(seed)
+    k = rng.randint(1, 6)
+    text = random_dna(rng, rng.randint(k, 80))
+    #Some entries are zero so ties (including all-zero windows) are covered
+    profile = {symbol: [rng.choice([0, 0.1, 0.2, 0.5]) for _ in range(k)] for symbol in "ACGT"}
+    assert compute_profile_most_probable_kmer(text, k, profile) == reference_most_probable_kmer(text, k, profile)
+
+@pytest.mark.parametrize("seed", range(10))
+def test_search_greedy_motif(seed):
+    rng = random.Random(seed)
+    t, n, k = rng.randint(2, 6), rng.randint(8, 30), rng.randint(2, 6)
+    dna = [random_dna(rng, n) for _ in range(t)]
+    motifs = search_greedy_motif(dna, k, t)
+    expected = reference_greedy_motif(dna, k, t)
+    assert motifs == expected
+    assert compute_score(motifs) == reference_score(expected)
+
+@pytest.mark.parametrize("seed", range(10))
+def test_score_from_counts(seed):
+    rng = random.Random(seed)
+    t, k = rng.randint(1, 8), rng.randint(1, 8)
+    motifs = [random_dna(rng, k) for _ in range(t)]
+    expected = reference_score(motifs)
+    assert compute_score(motifs) == expected
+    assert compute_score(motifs, count_motifs(motifs)) == expected
+    assert compute_score(motifs, count_motifs(motifs, pseudocount=1)) == expected
+    assert compute_score(motifs, get_count_matrix(motifs)) == expected
+    assert compute_score(motifs, get_pseudo_count_matrix(motifs)) == expected
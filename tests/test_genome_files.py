@@ -0,0 +1,35 @@
+#Genome files in the formats the loaders accept: plain text and FASTA
+import random
+
+import pytest
+
+from findingorigin.GenomeLoader import load_genome, validate_genome
+from findingorigin.SkewArray import read_genome_chunks
+
+def fasta(records, width):
+    text = ""
+    for name, sequence in records:
+        text += ">%s description\n" % name
+        text += "".join(sequence[i:i+width] + "\n" for i in range(0, len(sequence), width))
+    return text
+
+@pytest.mark.parametrize("seed", range(10))
+def test_fasta_records_make_one_genome(tmp_path, seed):
+    rng = random.Random(seed)
+    records = [("record%d" % r, "".join(rng.choice("ACGT") for _ in range(rng.randint(1, 300))))
+               for r in range(rng.randint(1, 3))]
+    genome = "".join(sequence for name, sequence in records)
+    path = tmp_path / "genome.fa"
+    path.write_text(fasta(records, rng.randint(1, 80)))
+
+    report = validate_genome(path.read_bytes())
+    assert report["invalid"] == {}
+    assert report["headers"] == len(records)
+    assert report["length"] == len(genome)
+    for chunk_size in (1, 5, 64, 1 << 22):
+        assert b"".join(read_genome_chunks(str(path), chunk_size)).decode() == genome
+    assert str(load_genome(str(path), cache=False)) == genome
+
+def test_symbols_in_sequence_lines_are_invalid():
+    report = validate_genome(">a\nACGT\n>b\nAC>GN\n")
+    assert report["invalid"] == {">": 1, "N": 1}